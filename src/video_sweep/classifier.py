@@ -1,11 +1,16 @@
 import os
 import re
+from functools import lru_cache
 
+# Series episodes carry a season/episode code such as S01E01
+_SERIES_RE = re.compile(r"[Ss]\d+[Ee]\d+")
 
+
+@lru_cache(maxsize=8192)
 def classify_video(filepath: str) -> str:
     """Classify video as 'movie' or 'series' based on filename heuristics."""
     filename = os.path.basename(filepath)
     # Simple heuristic: if filename contains S01E01 or similar, it's a series
-    if re.search(r"[Ss]\d+[Ee]\d+", filename):
+    if _SERIES_RE.search(filename):
         return "series"
     return "movie"
@@ -1,24 +1,33 @@
 import argparse
 import sys
 import os
-import logging
-from rich.console import Console
-from rich.table import Table
-import tomli
-from .finder import find_files
+import re
+from functools import lru_cache
+from .finder import iter_files
 from .classifier import classify_video
-from .renamer import rename_and_move, validate_movie_name
+from .omdb_cache import make_key
+from .renamer import (
+    parse_movie_filename,
+    rename_and_move_many,
+    series_new_filename,
+    validate_movie_name,
+)
 
 # For removing empty parent folders
-from .utils import remove_empty_parents
+from .utils import remove_empty_dirs
 
+# Patterns used while building the movie rows and in extract_title_year
+_PAREN_YEAR_END_RE = re.compile(r" \((\d{4})\)$")
+_YEAR_RE = re.compile(r"(\d{4})")
+_WS_RE = re.compile(r"\s+")
 
-def main():
-    # Check if OMDb API key is present
-    from .omdb import get_api_key_from_config
+# OMDb lookups are network-bound, so a thread pool overlaps their round trips
+_OMDB_MAX_WORKERS = 16
 
-    omdb_api_key = get_api_key_from_config()
-    show_omdb_columns = bool(omdb_api_key)
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command-line parser once; main() reuses it on every call."""
     parser = argparse.ArgumentParser(
         description="Find, classify, rename, and move video files."
     )
@@ -49,13 +58,25 @@ def main():
         help="Show the version number and exit",
         default=argparse.SUPPRESS,
     )
+    return parser
+
+
+def _print_version_and_exit():
+    from importlib.metadata import version
+
+    print(f"video-sweep version {version('video-sweep')}")
+    sys.exit(0)
+
+
+def main():
+    # A bare --version needs no parser at all
+    if sys.argv[1:] == ["--version"]:
+        _print_version_and_exit()
+    parser = _build_parser()
     args = parser.parse_args()
     # Handle --version
     if getattr(args, "version", False):
-        from importlib.metadata import version
-
-        print(f"video-sweep version {version('video-sweep')}")
-        sys.exit(0)
+        _print_version_and_exit()
 
     # Handle --init-config
     if args.init_config:
@@ -77,6 +98,13 @@ def main():
         print(f"Sample config written to {config_path}")
         sys.exit(0)
 
+    # Check if OMDb API key is present (after the --version/--init-config
+    # fast paths, which never need it)
+    from .omdb import get_api_key_from_config
+
+    omdb_api_key = get_api_key_from_config()
+    show_omdb_columns = bool(omdb_api_key)
+
     # Load config file if specified, or auto-load only when no CLI options are set
     config = {}
     has_cli_values = any(
@@ -87,9 +115,13 @@ def main():
     if not config_path and not has_cli_values and os.path.exists("config.toml"):
         config_path = os.path.join(os.getcwd(), "config.toml")
     if config_path:
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
         try:
             with open(config_path, "rb") as f:
-                config = tomli.load(f)
+                config = tomllib.load(f)
         except Exception as e:
             print(f"Error loading config file: {e}", file=sys.stderr)
             sys.exit(1)
@@ -128,150 +160,120 @@ def main():
     try:
         use_plain = os.environ.get("VIDEO_SWEEP_PLAIN") or not sys.stdout.isatty()
         if use_plain:
+            # Plain output never touches Rich, so skip importing it entirely
             console = None
         else:
-            import io
+            from rich.console import Console
+            from rich.table import Table
 
-            rich_buffer = io.StringIO()
-            console = Console(file=rich_buffer, force_terminal=True, color_system=None)
-        videos, non_videos = find_files(source)
+            # One console for both tables, writing straight to stdout
+            console = Console()
         results = []
         deleted_results = []
-        from .renamer import movie_new_filename
 
-        # Handle video files
-        from .renamer import series_new_filename
+        # Stream the tree once: classify videos as they are found and submit
+        # each movie's OMDb lookup straight away, so network round trips
+        # overlap the rest of the walk. Lookups are keyed like the OMDb cache,
+        # so titles differing only in case share one request. Non-video paths
+        # are only kept when they are going to be deleted. Each video is kept
+        # as (path, name, kind, parsed movie name) so nothing is recomputed
+        # when its row is built.
+        videos = []
+        omdb_executor = None
+        omdb_futures = {}
+        if show_omdb_columns:
+            from concurrent.futures import ThreadPoolExecutor
+
+            omdb_executor = ThreadPoolExecutor(max_workers=_OMDB_MAX_WORKERS)
+        # Pending lookups are cancelled rather than waited on if the scan fails
+        try:
+            for path, is_video in iter_files(source):
+                name = os.path.basename(path)
+                if not is_video:
+                    if clean_up:
+                        deleted_results.append({"file": path, "name": name})
+                    continue
+                kind = classify_video(path)
+                parsed = None
+                if kind == "movie":
+                    parsed = parse_movie_filename(name)
+                    title, year, _ = parsed
+                    if omdb_executor and title and year:
+                        key = make_key(title, year)
+                        if key not in omdb_futures:
+                            omdb_futures[key] = omdb_executor.submit(
+                                _validate_title_year, (title, year)
+                            )
+                videos.append((path, name, kind, parsed))
 
-        for video in videos:
-            kind = classify_video(video)
-            output_dir = series_output if kind == "series" else movie_output
-            filename = os.path.basename(video)
-            if kind == "movie":
-                new_filename = movie_new_filename(filename)
+            # Start the summary table; each row is emitted as soon as it is built
+            if use_plain:
+                header = "Files to move | Type | Destination"
                 if show_omdb_columns:
-                    # Extract title and year from new_filename for validation
-                    import re
-
-                    title_year_match = re.match(
-                        r"(.+?) \[(\d{4})\]",
-                        os.path.splitext(new_filename or filename)[0],
-                    )
-                    if title_year_match:
-                        extracted_title = title_year_match.group(1)
-                        extracted_year = title_year_match.group(2)
-                    else:
-                        extracted_title = None
-                        extracted_year = None
-                    # Validate movie name using OMDb
-                    valid = None
-                    suggested = None
-                    if extracted_title and extracted_year:
-                        valid, suggested = validate_movie_name(
-                            extracted_title,
-                            extracted_year,
-                            f"{extracted_title} [{extracted_year}]",
-                        )
-                        # If OMDb suggested name uses (YEAR), convert to [YEAR]
-                        if suggested:
-                            import re
-
-                            # Replace ' (YEAR)' at end with ' [YEAR]'
-                            suggested = re.sub(r" \((\d{4})\)$", r" [\1]", suggested)
-                    # Use suggested name for move if available
-                    ext = os.path.splitext(filename)[1]
-                    if suggested:
-                        target_filename = f"{suggested}{ext}"
-                    elif new_filename:
-                        target_filename = new_filename
-                    else:
-                        target_filename = filename
-                    target_path = os.path.join(output_dir, target_filename)
-                    # Store validation info
-                    validation = {
-                        "valid": "Yes" if valid else "No" if valid is not None else "-",
-                        "suggested": suggested or "",
-                    }
-                else:
-                    # No OMDb columns, skip validation
-                    target_path = os.path.join(output_dir, new_filename or filename)
-                    validation = {}
-
-            if kind == "series":
-                result = series_new_filename(filename)
-                if result:
-                    series_name, season_num, episode_code, new_filename = result
-                    season_folder = f"Season {season_num}"
-                    target_path = os.path.join(
-                        output_dir, series_name, season_folder, new_filename
-                    )
-                else:
-                    target_path = os.path.join(output_dir, filename)
-                validation = {"valid": "-", "suggested": ""}
-            elif kind not in ("movie", "series"):
-                target_path = os.path.join(output_dir, filename)
-                validation = {"valid": "-", "suggested": ""}
-            result_entry = {
-                "file": video,
-                "type": kind,
-                "target": target_path,
-                "output_dir": output_dir,
-            }
-            if show_omdb_columns:
-                result_entry["valid"] = validation.get("valid", "")
-                result_entry["suggested"] = validation.get("suggested", "")
-            results.append(result_entry)
-
-        # Prepare deleted files
-        if clean_up:
-            for file in non_videos:
-                deleted_results.append({"file": file})
-        # Print table summary using rich
-        if use_plain:
-            header = "Files to move | Type | Destination"
-            if show_omdb_columns:
-                header += " | Valid | Suggested Name"
-            print(header)
-            print("-" * len(header))
-            for r in results:
-                file_name = os.path.basename(os.path.normpath(r["file"]))
-                target = os.path.normpath(r["target"])
-                row = f"{file_name} | {r['type']} | {target}"
+                    header += " | Valid | Suggested Name"
+                print(header)
+                print("-" * len(header))
+            else:
+                table = Table()
+                table.add_column("Files to move", style="cyan", no_wrap=True)
+                table.add_column("Type")
+                table.add_column("Destination", style="green")
                 if show_omdb_columns:
-                    row += f" | {r.get('valid', '')} | {r.get('suggested', '')}"
-                print(row)
-        else:
-            table = Table()
-            table.add_column("Files to move", style="cyan", no_wrap=True)
-            table.add_column("Type")
-            table.add_column("Destination", style="green")
-            if show_omdb_columns:
-                table.add_column("Valid", style="magenta")
-                table.add_column("Suggested Name", style="yellow")
-            for r in results:
-                type_str = r["type"]
-                if type_str == "movie":
-                    type_str = f"[yellow]{type_str}[/yellow]"
-                elif type_str == "series":
-                    type_str = f"[blue]{type_str}[/blue]"
-                row_args = [
-                    os.path.basename(os.path.normpath(r["file"])),
-                    type_str,
-                    os.path.normpath(r["target"]),
-                ]
+                    table.add_column("Valid", style="magenta")
+                    table.add_column("Suggested Name", style="yellow")
+
+            # Handle video files
+            for video, filename, kind, parsed in videos:
+                output_dir = series_output if kind == "series" else movie_output
+                omdb_result = None
+                if show_omdb_columns and parsed and parsed[0] and parsed[1]:
+                    omdb_result = omdb_futures[make_key(parsed[0], parsed[1])].result()
+                handler = _KIND_HANDLERS.get(kind, _handle_other)
+                target_path, validation = handler(
+                    filename, output_dir, parsed, show_omdb_columns, omdb_result
+                )
+                result_entry = {
+                    "file": video,
+                    "name": filename,
+                    "type": kind,
+                    # Normalized once here rather than on every render
+                    "target": os.path.normpath(target_path),
+                    "output_dir": output_dir,
+                }
                 if show_omdb_columns:
-                    valid_str = r.get("valid", "")
-                    if valid_str == "No":
-                        valid_str = f"[red]{valid_str}[/red]"
-                    row_args.append(valid_str)
-                    row_args.append(r.get("suggested", ""))
-                table.add_row(*row_args)
+                    result_entry["valid"] = validation.get("valid", "")
+                    result_entry["suggested"] = validation.get("suggested", "")
+                results.append(result_entry)
+                target = result_entry["target"]
+                if use_plain:
+                    row = f"{filename} | {kind} | {target}"
+                    if show_omdb_columns:
+                        row += (
+                            f" | {result_entry['valid']} | {result_entry['suggested']}"
+                        )
+                    print(row)
+                else:
+                    type_str = kind
+                    if kind == "movie":
+                        type_str = f"[yellow]{kind}[/yellow]"
+                    elif kind == "series":
+                        type_str = f"[blue]{kind}[/blue]"
+                    row_args = [filename, type_str, target]
+                    if show_omdb_columns:
+                        valid_str = result_entry["valid"]
+                        if valid_str == "No":
+                            valid_str = f"[red]{valid_str}[/red]"
+                        row_args.append(valid_str)
+                        row_args.append(result_entry["suggested"])
+                    table.add_row(*row_args)
+        finally:
+            if omdb_executor:
+                for future in omdb_futures.values():
+                    future.cancel()
+                omdb_executor.shutdown(wait=False)
+
+        if not use_plain:
             console.print(table)
-            rich_buffer.flush()
-            print(rich_buffer.getvalue(), flush=True)
-            sys.stdout.flush()
-            # Clear buffer after printing
-            rich_buffer.truncate(0)
-            rich_buffer.seek(0)
 
         # Only show deleted table if --clean-up is specified
         if clean_up and deleted_results:
@@ -279,19 +281,13 @@ def main():
                 print("Files to delete")
                 print("-" * 20)
                 for r in deleted_results:
-                    print(os.path.basename(os.path.normpath(r["file"])))
+                    print(r["name"])
             else:
                 deleted_table = Table()
                 deleted_table.add_column("Files to delete", style="red", no_wrap=True)
                 for r in deleted_results:
-                    deleted_table.add_row(os.path.basename(os.path.normpath(r["file"])))
+                    deleted_table.add_row(r["name"])
                 console.print(deleted_table)
-                rich_buffer.flush()
-                print(rich_buffer.getvalue(), flush=True)
-                sys.stdout.flush()
-                # Clear buffer after printing
-                rich_buffer.truncate(0)
-                rich_buffer.seek(0)
 
         # Prompt for confirmation if not dry-run
         if not dry_run and (results or (clean_up and deleted_results)):
@@ -300,21 +296,16 @@ def main():
                 print("Aborted. No files were moved.")
                 sys.exit(0)
 
-            # Move video files
-            for r in results:
-                # Pass OMDb-suggested name if available and kind is movie
-                if r["type"] == "movie" and r.get("suggested"):
-                    rename_and_move(
-                        r["file"],
-                        r["type"],
-                        r["output_dir"],
-                        dry_run=False,
-                        omdb_suggested_name=r["suggested"],
-                    )
-                else:
-                    rename_and_move(
-                        r["file"], r["type"], r["output_dir"], dry_run=False
-                    )
+            # Move video files, passing the OMDb-suggested name for movies
+            rename_and_move_many(
+                (
+                    r["file"],
+                    r["type"],
+                    r["output_dir"],
+                    r.get("suggested") if r["type"] == "movie" else None,
+                )
+                for r in results
+            )
 
             # Delete files marked for deletion
             if clean_up:
@@ -325,47 +316,86 @@ def main():
                         print(f"Deleted: {file}")
                     except Exception as e:
                         print(f"Failed to delete {file}: {e}")
-                    # Remove empty parent folders up to source dir
-                    remove_empty_parents(os.path.dirname(file), source)
 
                 # After all deletions, remove any empty folders in the
-                # source directory tree (silently)
-                def remove_all_empty_dirs(root_dir):
-                    for dirpath, dirnames, filenames in os.walk(
-                        root_dir, topdown=False
-                    ):
-                        # Skip the root itself
-                        if dirpath == root_dir:
-                            continue
-                        if not dirnames and not filenames:
-                            try:
-                                os.rmdir(dirpath)
-                            except Exception as e:
-                                logging.debug(
-                                    f"Could not remove empty directory {dirpath}: {e}"
-                                )
-
-                remove_all_empty_dirs(source)
+                # source directory tree (silently). One bottom-up sweep also
+                # removes folders emptied by the deletions, so there is no
+                # per-file climb up the parents.
+                remove_empty_dirs(source)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def _handle_movie(filename, output_dir, parsed, show_omdb_columns, omdb_result):
+    """
+    Return (target_path, validation) for a movie. parsed is the
+    parse_movie_filename result and omdb_result the (valid, suggested) OMDb
+    validation, or None if the movie could not be looked up.
+    """
+    _, _, new_filename = parsed
+    if not show_omdb_columns:
+        # No OMDb columns, skip validation
+        return os.path.join(output_dir, new_filename or filename), {}
+    valid, suggested = omdb_result or (None, None)
+    # If OMDb suggested name uses (YEAR), convert to [YEAR]
+    if suggested:
+        # Replace ' (YEAR)' at end with ' [YEAR]'
+        suggested = _PAREN_YEAR_END_RE.sub(r" [\1]", suggested)
+    # Use suggested name for move if available
+    ext = os.path.splitext(filename)[1]
+    if suggested:
+        target_filename = f"{suggested}{ext}"
+    elif new_filename:
+        target_filename = new_filename
+    else:
+        target_filename = filename
+    validation = {
+        "valid": "Yes" if valid else "No" if valid is not None else "-",
+        "suggested": suggested or "",
+    }
+    return os.path.join(output_dir, target_filename), validation
+
+
+def _handle_series(filename, output_dir, *_):
+    """Return (target_path, validation) for a series episode."""
+    result = series_new_filename(filename)
+    if not result:
+        return _handle_other(filename, output_dir)
+    series_name, season_num, episode_code, new_filename = result
+    season_folder = f"Season {season_num}"
+    target_path = os.path.join(output_dir, series_name, season_folder, new_filename)
+    return target_path, {"valid": "-", "suggested": ""}
+
+
+def _handle_other(filename, output_dir, *_):
+    """Return (target_path, validation) for a file kept under its own name."""
+    return os.path.join(output_dir, filename), {"valid": "-", "suggested": ""}
+
+
+# Builds each row's target and validation by classify_video kind
+_KIND_HANDLERS = {"movie": _handle_movie, "series": _handle_series}
+
+
+def _validate_title_year(key):
+    title, year = key
+    return validate_movie_name(title, year, f"{title} [{year}]")
+
+
+@lru_cache(maxsize=8192)
 def extract_title_year(filename):
     """
     Extract title and year from a filename using the same logic as movie_new_filename.
     Returns (title, year) or (None, None) if not found.
     """
-    import re
-
     name = os.path.splitext(os.path.basename(filename))[0]
     name = name.replace("[", "").replace("]", "")
-    match = re.search(r"(\d{4})", name)
+    match = _YEAR_RE.search(name)
     if not match:
         return None, None
     year = match.group(1)
     title = name[: match.start()].replace(".", " ").strip()
     title = title.strip(" .")
-    title = re.sub(r"\s+", " ", title)
+    title = _WS_RE.sub(" ", title)
     return title, year
@@ -2,6 +2,55 @@ import os
 
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".m4v"}
 
+# Tuple form of VIDEO_EXTENSIONS for a single str.endswith check per filename
+_VIDEO_SUFFIXES = tuple(sorted(VIDEO_EXTENSIONS))
+
+
+def _iter_file_entries(source_dir: str):
+    """Yield a DirEntry for every file below source_dir.
+
+    Uses os.scandir directly so the file/directory check comes from the
+    directory listing itself rather than a separate stat() per entry.
+    Like os.walk, symlinked directories are not followed and unreadable
+    directories are skipped.
+    """
+    stack = [source_dir]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+                continue
+            yield entry
+        # Reverse so directories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+def iter_files(source_dir: str):
+    """Lazily yield (path, is_video) for every file in the source directory.
+
+    Files are produced as the tree is walked, so callers can process them
+    one at a time without holding the full listing in memory.
+    """
+    for entry in _iter_file_entries(source_dir):
+        name = entry.name
+        if name.startswith("._"):
+            continue
+        lower = name.lower()
+        # As with os.path.splitext, leading dots belong to the name, so a file
+        # called just ".mp4" has no extension
+        yield entry.path, lower.endswith(_VIDEO_SUFFIXES) and "." in lower.lstrip(".")
+
 
 def find_files(source_dir: str):
     """Recursively find all files in the source directory.
@@ -10,25 +59,18 @@ def find_files(source_dir: str):
     """
     videos = []
     non_videos = []
-    for root, _, files in os.walk(source_dir):
-        for file in files:
-            if file.startswith("._"):
-                continue
-            full_path = os.path.join(root, file)
-            if os.path.splitext(file)[1].lower() in VIDEO_EXTENSIONS:
-                videos.append(full_path)
-            else:
-                non_videos.append(full_path)
+    for path, is_video in iter_files(source_dir):
+        (videos if is_video else non_videos).append(path)
     return videos, non_videos
 
 
+def iter_videos(source_dir: str):
+    """Lazily yield the path of every video file in the source directory."""
+    for path, is_video in iter_files(source_dir):
+        if is_video:
+            yield path
+
+
 def find_videos(source_dir: str):
     """Recursively find all video files in the source directory."""
-    videos = []
-    for root, _, files in os.walk(source_dir):
-        for file in files:
-            if file.startswith("._"):
-                continue
-            if os.path.splitext(file)[1].lower() in VIDEO_EXTENSIONS:
-                videos.append(os.path.join(root, file))
-    return videos
+    return list(iter_videos(source_dir))
@@ -1,6 +1,79 @@
 import os
-import requests
-import toml
+import re
+import threading
+from difflib import SequenceMatcher
+from functools import lru_cache
+from .omdb_cache import CACHE_TTL, cached_lookup
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# rapidfuzz (optional) scores titles in C++; difflib is the pure-Python fallback
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+    from rapidfuzz.process import extract as _rapidfuzz_extract
+except ImportError:
+    _rapidfuzz_ratio = None
+    _rapidfuzz_extract = None
+
+OMDB_URL = "https://www.omdbapi.com/"
+# (connect, read) timeouts in seconds for every OMDb request
+OMDB_TIMEOUT = (3, 10)
+# Alphabetic words of a title, used to build simplified search titles
+_WORD_RE = re.compile(r"[A-Za-z]+")
+# At most this many progressively shorter titles are searched per lookup
+_MAX_SHORTENINGS = 2
+# Errors OMDb sends with a 200 when it simply has no match; any other error
+# (bad key, request limit) means the lookup could not be answered
+_MISS_ERRORS = ("Movie not found!", "Series not found!", "Too many results.")
+
+
+class _LookupFailed(Exception):
+    """OMDb did not answer a request, so its result must not be cached."""
+
+
+def _create_session():
+    """
+    Build the shared HTTP session used for all OMDb requests.
+    Keep-alive connections are pooled so concurrent lookups reuse them, and
+    transient failures (429/5xx, dropped connections) are retried with backoff.
+    """
+    # requests is only imported once a lookup actually needs the network
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Every encoding urllib3 can decode here: gzip and deflate, plus br/zstd
+    # when brotli or zstandard are installed
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Return the shared OMDb session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
 
 
 def get_api_key_from_config():
@@ -8,97 +81,212 @@ def get_api_key_from_config():
     env_key = os.environ.get("OMDB_API_KEY")
     if env_key:
         return env_key
+    return _read_api_key(_config_path())
+
+
+def get_cache_ttl():
+    """
+    Return how long, in seconds, found OMDb responses stay cached.
+    Set cache_ttl_days in the [omdb] section of config.toml to override the
+    omdb_cache.CACHE_TTL default.
+    """
+    days = _read_omdb_config(_config_path()).get("cache_ttl_days")
+    if isinstance(days, (int, float)) and days > 0:
+        return int(days * 24 * 60 * 60)
+    return CACHE_TTL
+
+
+def _config_path():
     config_path = os.path.join(
         os.path.dirname(os.path.dirname(__file__)), "..", "config.toml"
     )
-    config_path = os.path.abspath(config_path)
+    return os.path.abspath(config_path)
+
+
+def _read_api_key(config_path):
+    return _read_omdb_config(config_path).get("api_key")
+
+
+@lru_cache(maxsize=1)
+def _read_omdb_config(config_path):
+    # Parsed once per path; every OMDb query asks for the key
     try:
-        config = toml.load(config_path)
-        return config.get("omdb", {}).get("api_key")
+        with open(config_path, "rb") as f:
+            config = tomllib.load(f)
+        return config.get("omdb", {})
     except Exception:
-        return None
+        return {}
+
+
+def invalidate_api_key_cache():
+    """Forget the cached config.toml [omdb] settings, e.g. after the file changes."""
+    _read_omdb_config.cache_clear()
+
+
+def title_similarity(a, b):
+    """
+    Return the similarity of two titles as a ratio between 0.0 and 1.0.
+    Uses rapidfuzz when installed, otherwise difflib.SequenceMatcher.
+    """
+    if _rapidfuzz_ratio is not None:
+        return _rapidfuzz_ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def title_similarities(candidates, intended, cutoff=0.0):
+    """
+    Return the similarity of each candidate title to intended, in order.
+    Same scores as title_similarity, but computed in one rapidfuzz call, or
+    with difflib analysing the intended title once for every candidate.
+    Candidates that cannot reach cutoff score 0.0 without being fully compared.
+    """
+    if _rapidfuzz_ratio is not None:
+        ratios = [0.0] * len(candidates)
+        matches = _rapidfuzz_extract(
+            intended,
+            candidates,
+            scorer=_rapidfuzz_ratio,
+            limit=None,
+            score_cutoff=cutoff * 100,
+        )
+        for _, score, index in matches:
+            ratios[index] = score / 100.0
+        return ratios
+    matcher = SequenceMatcher(None, "", intended)
+    ratios = []
+    for candidate in candidates:
+        if candidate == intended:
+            ratios.append(1.0)
+            continue
+        matcher.set_seq1(candidate)
+        # Cheap upper bounds (lengths, then shared characters) first
+        if cutoff and (
+            matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff
+        ):
+            ratios.append(0.0)
+            continue
+        ratios.append(matcher.ratio())
+    return ratios
 
 
 def query_omdb(title, year=None):
     """
     Query OMDb API for a movie by title and optional year.
-    Returns dict with OMDb result or None if not found or no API key.
+    Returns dict with OMDb result or None if not found, no API key, or OMDb
+    could not answer. Found movies and misses are cached on disk, see
+    omdb_cache; failed requests are not, so they are retried next time.
     """
     api_key = get_api_key_from_config()
     if not api_key:
         return None
+    try:
+        return _query_omdb(title, year, api_key)
+    except _LookupFailed:
+        return None
+
+
+@cached_lookup(ttl=get_cache_ttl)
+def _query_omdb(title, year, api_key):
     params = {"t": title, "apikey": api_key}
     if year:
         params["y"] = str(year)
-    response = requests.get("http://www.omdbapi.com/", params=params, timeout=10)
-    if response.status_code == 200:
-        data = response.json()
-        if data.get("Response") == "True":
-            return data
-
-    # Fallback: use OMDb search endpoint and fuzzy match
-    from difflib import SequenceMatcher
-
-    def fuzzy_search(search_title, intended_title, intended_year=None):
-        search_params = {"s": search_title, "apikey": api_key}
-        search_response = requests.get(
-            "http://www.omdbapi.com/", params=search_params, timeout=10
-        )
-        if search_response.status_code == 200:
-            search_data = search_response.json()
-            if search_data.get("Response") == "True" and "Search" in search_data:
-                best_match = None
-                best_score = 0.0
-                for item in search_data["Search"]:
-                    candidate_title = item.get("Title", "")
-                    candidate_year = item.get("Year", "")
-                    ratio = SequenceMatcher(
-                        None, candidate_title.lower(), intended_title.lower()
-                    ).ratio()
-                    if intended_year:
-                        if candidate_year == str(intended_year):
-                            score = ratio + 0.2
-                        else:
-                            score = ratio - 0.2
-                    else:
-                        score = ratio
-                    if score > best_score:
-                        best_match = item
-                        best_score = score
-                threshold = 0.8 if intended_year else 0.9
-                if best_match and best_score >= threshold:
-                    imdb_id = best_match.get("imdbID")
-                    if imdb_id:
-                        id_params = {"i": imdb_id, "apikey": api_key}
-                        id_response = requests.get(
-                            "http://www.omdbapi.com/", params=id_params, timeout=10
-                        )
-                        if id_response.status_code == 200:
-                            id_data = id_response.json()
-                            if id_data.get("Response") == "True":
-                                return id_data
-        return None
+    data = _fetch(params)
+    if data.get("Response") == "True":
+        return data
+
+    # Fallback: use OMDb search endpoint and fuzzy match, stopping at the
+    # first variant that finds the movie
+    for variant in title_variants(title):
+        result = fuzzy_search(api_key, variant, variant, year)
+        if result:
+            return result
+    return None
+
 
-    # First try with full title
-    result = fuzzy_search(title, title, year)
-    if result:
-        return result
-    # Try with simplified title (alphabetic words only)
-    import re
+def _fetch(params):
+    """
+    Return the JSON body of an OMDb request that OMDb answered, whether or not
+    it found anything. Raises _LookupFailed for any other status (including
+    a 5xx left after retries) or a 200 carrying an error such as a bad key.
+    """
+    response = _get_session().get(OMDB_URL, params=params, timeout=OMDB_TIMEOUT)
+    if response.status_code != 200:
+        raise _LookupFailed(f"OMDb returned HTTP {response.status_code}")
+    data = response.json()
+    error = data.get("Error")
+    if data.get("Response") != "True" and error and error not in _MISS_ERRORS:
+        raise _LookupFailed(error)
+    return data
 
-    words = re.findall(r"[A-Za-z]+", title)
+
+def title_variants(title):
+    """
+    Return the titles to search for, most likely first and without repeats:
+    the full title, its alphabetic words only, then up to _MAX_SHORTENINGS
+    progressively shorter prefixes of those words (at least two words each).
+    """
+    variants = [title]
+    words = _WORD_RE.findall(title)
     if words:
-        simplified_title = " ".join(words)
-        if simplified_title != title:
-            result = fuzzy_search(simplified_title, simplified_title, year)
-            if result:
-                return result
-        # Try with progressively shorter substrings
-        for i in range(len(words) - 1, 1, -1):
-            short_title = " ".join(words[:i])
-            result = fuzzy_search(short_title, short_title, year)
-            if result:
-                return result
+        variants.append(" ".join(words))
+        shortest = max(1, len(words) - 1 - _MAX_SHORTENINGS)
+        for i in range(len(words) - 1, shortest, -1):
+            variants.append(" ".join(words[:i]))
+    return list(dict.fromkeys(variants))
+
+
+def best_search_match(items, intended_title, intended_year=None):
+    """
+    Return the OMDb search result that best matches intended_title, taking
+    intended_year into account, or None if none is close enough.
+    """
+    year = str(intended_year) if intended_year else None
+    titles = [item.get("Title", "").lower() for item in items]
+    intended = intended_title.lower()
+    # An exact title (in the right year) cannot be beaten, so nothing else
+    # needs scoring
+    for item, title in zip(items, titles):
+        if title == intended and (not year or item.get("Year", "") == year):
+            return item
+
+    best_match = None
+    best_score = 0.0
+    threshold = 0.8 if year else 0.9
+    # Lowest ratio that can still reach threshold with the year bonus, rounded
+    # so float drift (0.8 - 0.2 == 0.6000000000000001) cannot prune a ratio
+    # of exactly 0.6
+    cutoff = round(threshold - 0.2, 6) if year else threshold
+    ratios = title_similarities(titles, intended, cutoff)
+    for item, ratio in zip(items, ratios):
+        if year:
+            score = ratio + 0.2 if item.get("Year", "") == year else ratio - 0.2
+        else:
+            score = ratio
+        if score > best_score:
+            best_match = item
+            best_score = score
+    return best_match if best_score >= threshold else None
+
+
+@lru_cache(maxsize=512)
+def fuzzy_search(api_key, search_title, intended_title, intended_year=None):
+    """
+    Search OMDb for search_title and return the full OMDb record of the result
+    that best matches intended_title (and intended_year), or None.
+    Memoized per run, since shortened titles repeat across a library; a
+    failed request raises _LookupFailed instead, so it is not memoized.
+    """
+    search_data = _fetch({"s": search_title, "apikey": api_key})
+    if search_data.get("Response") == "True" and "Search" in search_data:
+        best_match = best_search_match(
+            search_data["Search"], intended_title, intended_year
+        )
+        if best_match:
+            imdb_id = best_match.get("imdbID")
+            if imdb_id:
+                id_data = _fetch({"i": imdb_id, "apikey": api_key})
+                if id_data.get("Response") == "True":
+                    return id_data
     return None
 
 
@@ -0,0 +1,109 @@
+"""
+omdb_cache.py: Persistent on-disk cache for OMDb responses.
+Re-scanning the same library reuses earlier responses instead of querying OMDb.
+"""
+
+import functools
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+# Found movies are reused for 7 days by default
+CACHE_TTL = 7 * 24 * 60 * 60
+# Misses (no match on OMDb) are retried sooner, in case of a typo being fixed
+# upstream or a newly listed title
+NEGATIVE_CACHE_TTL = 24 * 60 * 60
+
+# Returned by get_cached when there is no usable entry, since None is itself
+# a valid cached (negative) result
+MISS = object()
+
+
+def get_cache_path():
+    """
+    Return the path of the SQLite cache file.
+    VIDEO_SWEEP_CACHE_DIR overrides the default ~/.cache/video-sweep directory.
+    """
+    cache_dir = os.environ.get("VIDEO_SWEEP_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "video-sweep"
+    )
+    return os.path.join(cache_dir, "omdb.sqlite")
+
+
+def make_key(title, year):
+    """Return the cache key for a title/year lookup."""
+    return f"{title.lower().strip()}|{year or ''}"
+
+
+def _connect():
+    path = get_cache_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS omdb "
+        "(key TEXT PRIMARY KEY, payload TEXT, ts INTEGER)"
+    )
+    return conn
+
+
+def get_cached(title, year, ttl=CACHE_TTL):
+    """
+    Return the cached OMDb payload (a dict, or None for a cached miss).
+    Returns MISS if there is no entry, it has expired, or the cache is unavailable.
+    Found payloads expire after ttl seconds, misses after NEGATIVE_CACHE_TTL
+    (or ttl, if shorter).
+    """
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT payload, ts FROM omdb WHERE key = ?", (make_key(title, year),)
+            ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        logging.debug(f"OMDb cache read failed: {e}")
+        return MISS
+    if not row:
+        return MISS
+    payload = json.loads(row[0])
+    if payload is None:
+        ttl = min(ttl, NEGATIVE_CACHE_TTL)
+    if time.time() - row[1] > ttl:
+        return MISS
+    return payload
+
+
+def set_cached(title, year, payload):
+    """Store the OMDb payload (or None for a miss) for title/year."""
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO omdb (key, payload, ts) VALUES (?, ?, ?)",
+                (make_key(title, year), json.dumps(payload), int(time.time())),
+            )
+    except (sqlite3.Error, OSError) as e:
+        logging.debug(f"OMDb cache write failed: {e}")
+
+
+def cached_lookup(func=None, *, ttl=None):
+    """
+    Cache a func(title, year, *args) -> payload lookup on disk, keyed by
+    title and year only. Cache errors never break the lookup; it simply runs
+    uncached. A lookup that raises stores nothing, so failures are not
+    remembered as misses. ttl is an optional callable returning the TTL in
+    seconds, checked on every call; CACHE_TTL is used without it.
+    """
+    if func is None:
+        return functools.partial(cached_lookup, ttl=ttl)
+
+    @functools.wraps(func)
+    def wrapper(title, year, *args):
+        cached = get_cached(title, year, ttl() if ttl else CACHE_TTL)
+        if cached is not MISS:
+            return cached
+        payload = func(title, year, *args)
+        set_cached(title, year, payload)
+        return payload
+
+    return wrapper
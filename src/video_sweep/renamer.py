@@ -1,46 +1,104 @@
+import errno
 import os
 import shutil
 import re
+from functools import lru_cache
 from .omdb import query_omdb, get_suggested_name
 
+# Windows forbidden chars: < > : " / \ | ? *
+_FORBIDDEN_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_MULTISPACE_RE = re.compile(r"\s+")
+# Patterns used by parse_movie_filename
+_FOUR_DIGITS_RE = re.compile(r"(\d{4})")
+_BRACKETED_YEAR_RE = re.compile(r"[\[(](\d{4})[\])]")
+# Patterns used by series_new_filename
+_PAREN_YEAR_RE = re.compile(r"\(\d{4}\)")
+_EPISODE_RE = re.compile(r"S(\d{2})E(\d{2})", re.IGNORECASE)
+# OMDb's 'Title (YEAR)' suffix, rewritten to ' [YEAR]'
+_PAREN_YEAR_END_RE = re.compile(r" \((\d{4})\)$")
 
+
+# The pure filename functions below are memoized: the CLI parses each name
+# once for the preview and again when moving it
+@lru_cache(maxsize=2048)
 def sanitize_filename(name: str) -> str:
     """
     Remove or replace characters not allowed in Windows filenames.
     Periods (.) and dashes (-) are allowed and preserved.
     """
-    # Windows forbidden chars: < > : " / \ | ? *
     # Do NOT remove . or -
-    return re.sub(r'[<>:"/\\|?*]', "", name)
+    return _FORBIDDEN_CHARS_RE.sub("", name)
 
 
-def movie_new_filename(filename: str) -> str:
-    """Generate new filename for a movie: title [year].ext. If no year, return None."""
+@lru_cache(maxsize=4096)
+def parse_movie_filename(filename: str) -> tuple:
+    """
+    Parse a movie filename into its title, year and new filename.
+    Returns (title, year, new_filename); title and year are None when they
+    cannot be determined, and new_filename is None if no year is found.
+    """
     name, ext = os.path.splitext(filename)
     # Remove all [ and ] from the original name
     name_clean = name.replace("[", "").replace("]", "")
+    # One search finds the first 4-digit number; names without one bail out
+    # here without running any other pattern
+    match = _FOUR_DIGITS_RE.search(name_clean)
+    if not match:
+        return None, None, None
     # If filename starts with a 4-digit number, treat as title, look for year elsewhere
-    m_start = re.match(r"^(\d{4})(.*)", name_clean)
-    if m_start:
-        title = m_start.group(1).strip()
+    if match.start() == 0:
+        title = match.group(1)
         # Look for year in brackets/parentheses after title
-        m_year = re.search(r"[\[(](\d{4})[\])]", name)
+        m_year = _BRACKETED_YEAR_RE.search(name)
         if m_year:
             year = m_year.group(1)
-            return sanitize_filename(f"{title} [{year}]{ext}")
+            return title, year, sanitize_filename(f"{title} [{year}]{ext}")
         # Fallback: if no year found, just use the title
-        return sanitize_filename(f"{title}{ext}")
+        return None, None, sanitize_filename(f"{title}{ext}")
     # Otherwise, use the first 4-digit number as year
-    match = re.search(r"(\d{4})", name_clean)
-    if not match:
-        return None
     year = match.group(1)
     title = name_clean[: match.start()].replace(".", " ").strip()
     # Remove trailing/leading spaces and periods
     title = title.strip(" .")
     # Replace multiple spaces with a single space
-    title = re.sub(r"\s+", " ", title)
-    return sanitize_filename(f"{title} [{year}]{ext}")
+    title = sanitize_filename(_MULTISPACE_RE.sub(" ", title))
+    return title or None, year, sanitize_filename(f"{title} [{year}]{ext}")
+
+
+def movie_new_filename(filename: str) -> str:
+    """Generate new filename for a movie: title [year].ext. If no year, return None."""
+    return parse_movie_filename(filename)[2]
+
+
+# Directories already created (or found) by _ensure_dir in this process
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create path if needed, skipping the syscalls for directories seen before."""
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+def _fast_move(src: str, dst: str, replace: bool = False) -> None:
+    """
+    Move src to dst with a single rename when both are on the same filesystem.
+    Across filesystems (EXDEV), fall back to copying the data and metadata,
+    then unlinking src. With replace=True an existing dst is overwritten
+    atomically; otherwise callers are expected to have checked dst.
+    """
+    try:
+        if replace:
+            os.replace(src, dst)
+        else:
+            os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
+        os.unlink(src)
 
 
 def rename_and_move(
@@ -53,9 +111,97 @@ def rename_and_move(
     """Rename and move the video file to the target directory.
     If dry_run, only print the action.
     If omdb_suggested_name is provided (and kind==movie), use it as the new filename."""
+    target_path = _move_target(filepath, kind, target_dir, omdb_suggested_name)
+    if not target_path:
+        return
+    if os.path.exists(target_path):
+        print(f"Warning: Target file '{target_path}' already exists. Skipping move.")
+        return
+    if dry_run:
+        print(f"Would move: {filepath} -> {target_path}")
+        return
+    try:
+        _fast_move(filepath, target_path)
+        print(f"Moved: {filepath} -> {target_path}")
+    except Exception as e:
+        print(f"Failed to move {filepath}: {e}")
+
+
+def rename_and_move_many(jobs, dry_run: bool = False, max_workers: int = 4) -> None:
+    """Rename and move many video files, as rename_and_move does for each.
+    jobs are (filepath, kind, target_dir, omdb_suggested_name) tuples.
+    The moves run on a thread pool, since copies across filesystems block on
+    I/O; messages are still printed in job order."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    planned = []
+    claimed = set()
+    ignores_case = {}
+    for filepath, kind, target_dir, omdb_suggested_name in jobs:
+        target_path = _move_target(filepath, kind, target_dir, omdb_suggested_name)
+        if not target_path:
+            continue
+        # A target taken by an earlier job counts as existing, as it would
+        # when moving one at a time. normcase folds case on Windows; where the
+        # target directory ignores case (as on macOS by default) the claim
+        # is folded too, or a second rename would silently replace the first
+        claim = os.path.normcase(target_path)
+        directory = os.path.dirname(target_path)
+        if directory not in ignores_case:
+            ignores_case[directory] = _ignores_case(directory)
+        if ignores_case[directory]:
+            claim = claim.casefold()
+        if claim in claimed or os.path.exists(target_path):
+            print(
+                f"Warning: Target file '{target_path}' already exists. Skipping move."
+            )
+            continue
+        claimed.add(claim)
+        if dry_run:
+            print(f"Would move: {filepath} -> {target_path}")
+            continue
+        planned.append((filepath, target_path))
+    if not planned:
+        return
+
+    def move(job):
+        try:
+            _fast_move(*job)
+        except Exception as e:
+            return e
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(planned))) as executor:
+        for (filepath, target_path), error in zip(planned, executor.map(move, planned)):
+            if error:
+                print(f"Failed to move {filepath}: {error}")
+            else:
+                print(f"Moved: {filepath} -> {target_path}")
+
+
+def _ignores_case(directory: str) -> bool:
+    """Return whether names in directory, or its nearest existing parent,
+    are matched regardless of case."""
+    path = os.path.abspath(directory)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return False
+        path = parent
+    swapped = path.swapcase()
+    if swapped == path or not os.path.exists(swapped):
+        return False
+    return os.path.samefile(path, swapped)
+
+
+def _move_target(filepath, kind, target_dir, omdb_suggested_name=None):
+    """
+    Return the path filepath should be moved to, creating its directories,
+    or None (after printing a warning) if it cannot be renamed.
+    """
     filename = os.path.basename(filepath)
     # All types: move directly to target_dir, no subfolder
-    os.makedirs(target_dir, exist_ok=True)
+    _ensure_dir(target_dir)
 
     if kind == "movie":
         # Use OMDb-suggested name if provided
@@ -66,47 +212,25 @@ def rename_and_move(
             new_filename = movie_new_filename(filename)
         if not new_filename:
             print(f"Warning: No year found in '{filename}'. Skipping rename/move.")
-            return
+            return None
         target_path = os.path.join(target_dir, new_filename)
-        if os.path.exists(target_path):
-            print(
-                f"Warning: Target file '{target_path}' already exists. Skipping move."
-            )
-            return
     elif kind == "series":
         result = series_new_filename(filename)
         if not result:
             print(
                 f"Warning: No episode code found in '{filename}'. Skipping rename/move."
             )
-            return
+            return None
         series_name, season_num, episode_code, new_filename = result
         season_folder = f"Season {season_num}"
         target_path = os.path.join(target_dir, series_name, season_folder, new_filename)
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        if os.path.exists(target_path):
-            print(
-                f"Warning: Target file '{target_path}' already exists. Skipping move."
-            )
-            return
+        _ensure_dir(os.path.dirname(target_path))
     else:
         target_path = os.path.join(target_dir, filename)
-        if os.path.exists(target_path):
-            print(
-                f"Warning: Target file '{target_path}' already exists. Skipping move."
-            )
-            return
-
-    if dry_run:
-        print(f"Would move: {filepath} -> {target_path}")
-        return
-    try:
-        shutil.move(filepath, target_path)
-        print(f"Moved: {filepath} -> {target_path}")
-    except Exception as e:
-        print(f"Failed to move {filepath}: {e}")
+    return target_path
 
 
+@lru_cache(maxsize=4096)
 def series_new_filename(filename: str) -> tuple:
     """
     Generate new filename and output path for a series episode.
@@ -114,10 +238,11 @@ def series_new_filename(filename: str) -> tuple:
     not matched.
     """
     name, ext = os.path.splitext(filename)
-    # Remove year in brackets, e.g. (2014)
-    name = re.sub(r"\(\d{4}\)", "", name)
+    # Remove year in brackets, e.g. (2014); most names have no "(" at all
+    if "(" in name:
+        name = _PAREN_YEAR_RE.sub("", name)
     # Find episode code SxxEyy
-    ep_match = re.search(r"S(\d{2})E(\d{2})", name, re.IGNORECASE)
+    ep_match = _EPISODE_RE.search(name)
     if not ep_match:
         return None
     season_num = int(ep_match.group(1))
@@ -125,27 +250,34 @@ def series_new_filename(filename: str) -> tuple:
     # Series name: everything before episode code
     series_name = name[: ep_match.start()].replace(".", " ").replace("-", " ").strip()
     # Remove extra spaces
-    series_name = re.sub(r"\s+", " ", series_name)
+    series_name = _MULTISPACE_RE.sub(" ", series_name)
     # Remove trailing/leading spaces and periods
     series_name = series_name.strip(" .")
     new_filename = f"{series_name} {episode_code}{ext}"
     return series_name, season_num, episode_code, new_filename
 
 
-def validate_movie_name(extracted_title, extracted_year, current_name):
+def omdb_suggestion(extracted_title, extracted_year):
+    """
+    Look up a movie on OMDb and return (found, suggested), where suggested is
+    the filesystem-safe OMDb name in 'Title [YEAR]' form (or None).
+    """
     omdb_data = query_omdb(extracted_title, extracted_year)
     if not omdb_data:
         return False, None
     suggested = get_suggested_name(omdb_data)
     # Normalize OMDb suggested name to [YEAR] format for comparison
-    import re
-
     if suggested:
         # Sanitize for filesystem before proposing/validating
         suggested = sanitize_filename(suggested)
-        suggested_normalized = re.sub(r" \((\d{4})\)$", r" [\1]", suggested)
-    else:
-        suggested_normalized = None
+        suggested = _PAREN_YEAR_END_RE.sub(r" [\1]", suggested)
+    return True, suggested
+
+
+def validate_movie_name(extracted_title, extracted_year, current_name):
+    found, suggested_normalized = omdb_suggestion(extracted_title, extracted_year)
+    if not found:
+        return False, None
     # Compare normalized names
     correct = (
         suggested_normalized and suggested_normalized.lower() == current_name.lower()
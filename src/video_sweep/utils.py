@@ -1,29 +1,39 @@
+import logging
 import os
 
 """
 utils.py: Utility functions for video-sweep project.
-Includes remove_empty_parents for cleaning up empty directories after file operations.
+Includes remove_empty_dirs for cleaning up empty directories
+after file operations.
 """
 
 
-def remove_empty_parents(path, stop_dir):
+def remove_empty_dirs(root_dir):
     """
-    Recursively remove empty parent directories up to stop_dir (not including stop_dir).
+    Remove every empty directory below root_dir (root_dir itself is kept).
+    Directories that only contain empty directories are removed as well.
+    Uses os.scandir so directory checks come from the listing, without extra stat calls.
     Args:
-        path (str): Path to start checking from (usually the file's parent directory).
-        stop_dir (str): Directory at which to stop (do not remove this directory).
+        root_dir (str): Directory whose empty subdirectories should be removed.
     """
-    path = os.path.abspath(path)
-    stop_dir = os.path.abspath(stop_dir)
-    while True:
-        parent = os.path.dirname(path)
-        if parent == path or path == stop_dir:
-            break
+
+    def sweep(dirpath):
+        # Returns True if dirpath is empty once its subdirectories are swept
+        empty = True
         try:
-            if not os.listdir(path):
-                os.rmdir(path)
-            else:
-                break
-        except Exception:
-            break
-        path = parent
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError as e:
+            logging.debug(f"Could not scan directory {dirpath}: {e}")
+            return False
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and sweep(entry.path):
+                try:
+                    os.rmdir(entry.path)
+                    continue
+                except OSError as e:
+                    logging.debug(f"Could not remove empty directory {entry.path}: {e}")
+            empty = False
+        return empty
+
+    sweep(root_dir)
@@ -0,0 +1,103 @@
+import contextlib
+import io
+import logging
+import os
+import sys
+from importlib import metadata
+
+import pytest
+from video_sweep import omdb, renamer
+from video_sweep.cli import main as cli_main
+
+
+@pytest.fixture(autouse=True)
+def _isolated_omdb_cache(tmp_path, monkeypatch):
+    # Keep the on-disk OMDb cache out of the user's home directory and
+    # make sure no lookup result leaks from one test into another
+    monkeypatch.setenv("VIDEO_SWEEP_CACHE_DIR", str(tmp_path / "omdb-cache"))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_in_process_caches():
+    # Each test sees config.toml as it is now, not as an earlier test left it,
+    # and fuzzy searches are never answered from another test's mocks
+    omdb.invalidate_api_key_cache()
+    omdb.fuzzy_search.cache_clear()
+    yield
+    omdb.invalidate_api_key_cache()
+    omdb.fuzzy_search.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_cli_globals():
+    # In-process main() calls must not leave logging handlers or levels, or
+    # directories remembered by the renamer, behind for the next test
+    root = logging.getLogger()
+    saved = root.level, root.handlers[:]
+    yield
+    root.setLevel(saved[0])
+    root.handlers[:] = saved[1]
+    renamer._ENSURED_DIRS.clear()
+
+
+@pytest.fixture(scope="session")
+def cli_dirs(tmp_path_factory):
+    # Empty source/series/target folders shared by tests that never write to
+    # them; tests that create files use their own tmp_path
+    base = tmp_path_factory.mktemp("cli")
+    dirs = base / "source", base / "series", base / "target"
+    for d in dirs:
+        d.mkdir()
+    return dirs
+
+
+@pytest.fixture(scope="session")
+def pkg_version():
+    # Installed video-sweep version, read from the package metadata once;
+    # None when the package is only importable from a source checkout
+    try:
+        return metadata.version("video-sweep")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+@pytest.fixture
+def cli_tmp_dirs(tmp_path):
+    # Fresh source/series/target folders for tests that write into them
+    dirs = tmp_path / "source", tmp_path / "series", tmp_path / "target"
+    for d in dirs:
+        d.mkdir()
+    return dirs
+
+
+class CliRunner:
+    """Run video_sweep.cli.main() in-process, isolated from the test session."""
+
+    def invoke(self, args, cwd=None):
+        """Run the CLI with given args and return (exitcode, stdout, stderr)."""
+        out, err = io.StringIO(), io.StringIO()
+        old_argv, old_cwd = sys.argv, os.getcwd()
+        sys.argv = ["video-sweep"] + args
+        code = 0
+        try:
+            if cwd:
+                os.chdir(cwd)
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                try:
+                    cli_main()
+                except SystemExit as e:
+                    code = e.code
+        finally:
+            sys.argv = old_argv
+            os.chdir(old_cwd)
+        if isinstance(code, str):
+            # Mirror the interpreter: a message exit prints it and returns 1
+            err.write(f"{code}\n")
+            code = 1
+        return code or 0, out.getvalue(), err.getvalue()
+
+
+@pytest.fixture
+def cli_runner():
+    # Replaces running `python -m video_sweep` in a subprocess per test
+    return CliRunner()
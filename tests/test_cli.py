@@ -1,188 +1,135 @@
-import subprocess
+import re
+import runpy
 import sys
-import tempfile
-
-
-def run_cli(args, cwd=None):
-    """Run the CLI with given args and return (exitcode, stdout, stderr)."""
-    # Build command with controlled test arguments (no untrusted input)
-    # args are always generated by test functions, never from external input
-    cmd = [sys.executable, "-m", "video_sweep"] + args
-    result = subprocess.run(  # noqa: S603 - test-controlled args only
-        cmd,
-        cwd=cwd,
-        capture_output=True,
-        text=True,
-        shell=False,  # Explicitly set to prevent shell injection
-    )
-    return result.returncode, result.stdout, result.stderr
+from unittest.mock import patch
+
+import pytest
+from video_sweep.cli import main as cli_main
+
+_SEMVER_RE = re.compile(r"\d+\.\d+\.\d+")
+
+
+def _argv(src, series, tgt, *extra):
+    """Return the CLI arguments for the given source/series/movie folders."""
+    return [
+        "--source",
+        str(src),
+        "--series-output",
+        str(series),
+        "--movie-output",
+        str(tgt),
+        *extra,
+    ]
+
+
+def _write_config(path, src, series, tgt, *extra):
+    """Write a config.toml for the given folders plus any extra lines."""
+    lines = [
+        f'source = "{str(src).replace(chr(92), "/")}"',
+        f'series_output = "{str(series).replace(chr(92), "/")}"',
+        f'movie_output = "{str(tgt).replace(chr(92), "/")}"',
+        *extra,
+    ]
+    path.write_text("\n".join(lines) + "\n")
+
 
+def _has_any(out, err, *needles):
+    """Return whether any lower-case needle occurs in stdout or stderr."""
+    out_lower, err_lower = (out or "").lower(), (err or "").lower()
+    return any(n in out_lower or n in err_lower for n in needles)
 
-def test_cli_help():
-    code, out, err = run_cli(["--help"])
-    # Print outputs for debugging in CI
-    print("STDOUT:", out)
-    print("STDERR:", err)
-    print("EXIT CODE:", code)
+
+def test_cli_help(cli_runner):
+    code, out, err = cli_runner.invoke(["--help"])
+    out_lower = out.lower()
     assert code == 0
-    assert "usage" in out.lower() or "options" in out.lower()
+    assert "usage" in out_lower or "options" in out_lower
 
 
-def test_cli_dry_run(tmp_path):
+def test_cli_dry_run(tmp_path, cli_runner):
     src = tmp_path / "source"
     tgt = tmp_path / "target"
     src.mkdir()
     tgt.mkdir()
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
     # Provide all required arguments
     series = tmp_path / "series"
     series.mkdir()
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    print(f"CLI OUT: {out!r}")
-    print(f"CLI ERR: {err!r}")
     assert out is not None, f"No output captured from CLI. STDERR: {err!r}"
     # Check that the output table contains some .mp4 file in the destination column
     assert ".mp4" in out, f"Expected .mp4 in output, got: {out!r}"
 
 
-def test_cli_no_source():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        src = tmpdir
-        series = tmpdir  # Not used, but required
-        tgt = tmpdir
-        code, out, err = run_cli(
-            [
-                "--source",
-                src,
-                "--series-output",
-                series,
-                "--movie-output",
-                tgt,
-            ]
-        )
-        # Should exit 0 and print an empty table (no files to move)
-        assert code == 0
-        print(f"CLI OUT: {out!r}")
-        print(f"CLI ERR: {err!r}")
-        assert out is not None, f"No output captured from CLI. STDERR: {err!r}"
-        assert (
-            "files to move" in out.lower()
-        ), f"Expected 'files to move' in output, got: {out!r}"
-        # Table should have no video files listed
-        assert "| movie" not in out.lower(), f"Unexpected movie row in output: {out!r}"
-
-
-def test_cli_init_config(tmp_path):
-    config_path = tmp_path / "sample_config.toml"
-    code, out, err = run_cli(["--init-config", str(config_path)])
+def test_cli_no_source(cli_dirs, cli_runner):
+    src, series, tgt = cli_dirs
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt))
+    out_lower = out.lower()
+    # Should exit 0 and print an empty table (no files to move)
     assert code == 0
-    assert config_path.exists()
-    assert "Sample config written" in out
-
-
-def test_cli_init_config_auto_adds_toml_extension(tmp_path):
-    """Test that .toml extension is automatically added if missing."""
-    config_path = tmp_path / "myconfig"
-    code, out, err = run_cli(["--init-config", str(config_path)])
+    assert out is not None, f"No output captured from CLI. STDERR: {err!r}"
+    assert (
+        "files to move" in out_lower
+    ), f"Expected 'files to move' in output, got: {out!r}"
+    # Table should have no video files listed
+    assert "| movie" not in out_lower, f"Unexpected movie row in output: {out!r}"
+
+
+@pytest.mark.parametrize(
+    "given_name, expected_name",
+    [
+        ("sample_config.toml", "sample_config.toml"),
+        # The .toml extension is added automatically if missing
+        ("myconfig", "myconfig.toml"),
+    ],
+)
+def test_cli_init_config(tmp_path, cli_runner, given_name, expected_name):
+    code, out, err = cli_runner.invoke(["--init-config", str(tmp_path / given_name)])
     assert code == 0
-    # Should create myconfig.toml, not myconfig
-    expected_path = tmp_path / "myconfig.toml"
+    expected_path = tmp_path / expected_name
     assert expected_path.exists()
+    assert "source =" in expected_path.read_text()
+    assert (tmp_path / given_name).exists() == (given_name == expected_name)
     assert "Sample config written" in out
-    assert "myconfig.toml" in out
-
-
-def test_cli_no_arguments(tmp_path):
-    """Test that running with no arguments exits gracefully."""
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    src.mkdir()
-    tgt.mkdir()
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--movie-output",
-            str(tgt),
-        ]
-    )
-    # Accept both 0 and 1 to match CLI behavior
-    assert code in (0, 1)
-    output = (out or "") + (err or "")
-    output_lower = output.lower()
-    assert (
-        "required" in output_lower
-        or "error" in output_lower
-        or "files to move" in output_lower
-        or "type" in output_lower
-        or "usage" in output_lower
-        or "options" in output_lower
-    )
+    assert expected_name in out
 
 
-def test_cli_version():
-    code, out, err = run_cli(["--version"])
+def test_cli_version(cli_runner):
+    code, out, err = cli_runner.invoke(["--version"])
     assert code == 0
     assert "version" in out.lower()
     # Assert version pattern (e.g., 0.3.0) instead of specific version
-    import re
+    assert _SEMVER_RE.search(out), "Expected semantic version format"
 
-    assert re.search(r"\d+\.\d+\.\d+", out), "Expected semantic version format"
 
-
-def test_version_retrieval_from_metadata():
+def test_version_retrieval_from_metadata(pkg_version):
     """Test that version can be retrieved from importlib.metadata."""
-    import re
-    from importlib.metadata import version
-
-    try:
-        v = version("video-sweep")
-        assert re.search(r"\d+\.\d+\.\d+", v), f"Expected semantic version, got: {v}"
-    except Exception as e:
-        # If package not installed, that's ok for this unit test
-        assert "video-sweep" in str(e).lower() or "not found" in str(e).lower()
+    # If package not installed, that's ok for this unit test
+    if pkg_version is not None:
+        assert _SEMVER_RE.search(
+            pkg_version
+        ), f"Expected semantic version, got: {pkg_version}"
 
 
-def test_version_flag_direct(monkeypatch, capsys):
+def test_version_flag_direct(monkeypatch, capsys, pkg_version):
     """Test --version flag directly to ensure importlib.metadata is covered."""
-    from video_sweep.cli import main
-    from importlib.metadata import version as get_version
-
-    # Pre-verify the version lookup works
-    try:
-        actual_version = get_version("video-sweep")
-    except Exception:
-        actual_version = None
-
     monkeypatch.setattr(sys, "argv", ["video-sweep", "--version"])
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code == 0
 
     captured = capsys.readouterr()
     assert "version" in captured.out.lower()
     # Assert version pattern instead of specific version
-    import re
-
-    assert re.search(r"\d+\.\d+\.\d+", captured.out), "Expected semantic version format"
+    assert _SEMVER_RE.search(captured.out), "Expected semantic version format"
 
     # If we got here, the version was successfully retrieved and printed
-    if actual_version:
-        assert actual_version in captured.out
+    if pkg_version:
+        assert pkg_version in captured.out
 
 
 def test_main_module_execution(monkeypatch, capsys):
@@ -191,12 +138,8 @@ def test_main_module_execution(monkeypatch, capsys):
     monkeypatch.setattr(sys, "argv", ["video-sweep", "--help"])
 
     # Import __main__ module to cover it
-    import importlib
     import video_sweep.__main__
 
-    # Reload to ensure fresh execution
-    importlib.reload(video_sweep.__main__)
-
     # The module should have imported the main function
     assert hasattr(video_sweep.__main__, "main")
 
@@ -206,79 +149,35 @@ def test_main_module_direct_call(monkeypatch, capsys):
 
     Cover if __name__ == '__main__' block.
     """
-    # This tests the direct execution path
-    # Execute the __main__ module code by running it as a subprocess
     import video_sweep
     import os
 
     main_path = os.path.join(os.path.dirname(video_sweep.__file__), "__main__.py")
+    monkeypatch.setattr(sys, "argv", [main_path, "--version"])
 
-    # Run the __main__.py module as a subprocess
-    result = subprocess.run(  # noqa: S603 - test-controlled args only
-        [sys.executable, main_path, "--version"],
-        capture_output=True,
-        text=True,
-    )
-
-    # Expected to exit with code 0 for --version
-    assert result.returncode == 0
-    assert "version" in result.stdout.lower()
-
-
-# Direct unit tests for coverage (bypassing subprocess)
-def test_init_config_with_extension_direct(tmp_path, monkeypatch):
-    """Test --init-config directly to ensure .toml extension handling is covered."""
-    from video_sweep.cli import main
-
-    config_path = tmp_path / "testconfig.toml"
-    monkeypatch.setattr(sys, "argv", ["video-sweep", "--init-config", str(config_path)])
-
-    try:
-        main()
-    except SystemExit as e:
-        assert e.code == 0
-
-    assert config_path.exists()
-    content = config_path.read_text()
-    assert "source =" in content
-
-
-def test_init_config_auto_extension_direct(tmp_path, monkeypatch):
-    """Test --init-config adds .toml extension when missing.
-
-    Direct call for coverage.
-    """
-    import sys
-    from video_sweep.cli import main
-
-    config_path_no_ext = tmp_path / "myconfig"
-    monkeypatch.setattr(
-        sys, "argv", ["video-sweep", "--init-config", str(config_path_no_ext)]
-    )
-
+    # Run __main__.py as a script in this process; with no parent package its
+    # relative import fails and it falls back to the absolute one
     try:
-        main()
+        runpy.run_path(main_path, run_name="__main__")
     except SystemExit as e:
-        assert e.code == 0
+        # Expected to exit with code 0 for --version
+        assert e.code in (0, None)
 
-    # Should create myconfig.toml, not myconfig
-    expected_path = tmp_path / "myconfig.toml"
-    assert expected_path.exists()
-    assert not config_path_no_ext.exists()
+    assert "version" in capsys.readouterr().out.lower()
 
 
+# Direct unit tests for coverage (bypassing subprocess)
 def test_no_args_exits_gracefully_direct(monkeypatch, capsys):
     """Test that running with no arguments exits gracefully.
 
     Direct call for coverage.
     """
     import sys
-    from video_sweep.cli import main
 
     monkeypatch.setattr(sys, "argv", ["video-sweep"])
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         # Accept both 0 (success) and 1 (usage error/help)
         assert e.code in (0, 1)
@@ -300,7 +199,6 @@ def test_no_args_exits_gracefully_direct(monkeypatch, capsys):
 def test_path_normalization_direct(tmp_path, monkeypatch, capsys):
     """Test that paths are normalized after validation (direct call for coverage)."""
     import sys
-    from video_sweep.cli import main
 
     src = tmp_path / "source"
     series = tmp_path / "series"
@@ -312,28 +210,19 @@ def test_path_normalization_direct(tmp_path, monkeypatch, capsys):
     # Create a dummy video file so we get past the validation and into
     # the processing code
     video_file = src / "test.movie.2023.mp4"
-    video_file.write_text("")
+    video_file.touch()
 
     # Add trailing slashes to test normalization
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            f"{src}/",
-            "--series-output",
-            f"{series}/",
-            "--movie-output",
-            f"{movies}/",
-            "--dry-run",
-        ],
+        ["video-sweep", *_argv(f"{src}/", f"{series}/", f"{movies}/", "--dry-run")],
     )
 
     # In dry-run mode with video files, main() prints the table and exits gracefully
     # We don't assert on exit code as the behavior may vary
     try:
-        main()
+        cli_main()
     except SystemExit:
         # Expected - main() calls sys.exit() after displaying the table
         pass
@@ -347,142 +236,52 @@ def test_path_normalization_direct(tmp_path, monkeypatch, capsys):
 # Additional CLI error path coverage
 
 
-def test_cli_missing_source(tmp_path):
-    # Missing --source
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    tgt.mkdir()
-    series.mkdir()
-    code, out, err = run_cli(
-        [
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-        ]
-    )
+@pytest.mark.parametrize("drop", ["--source", "--series-output", "--movie-output"])
+def test_cli_missing_arg(cli_dirs, cli_runner, drop):
+    # Each of the three folders is required
+    src, series, tgt = cli_dirs
+    args = {
+        "--source": str(src),
+        "--series-output": str(series),
+        "--movie-output": str(tgt),
+    }
+    args.pop(drop)
+    code, out, err = cli_runner.invoke([x for kv in args.items() for x in kv])
     assert code == 1
-    output = (out or "") + (err or "")
-    assert "required" in output.lower() or "error" in output.lower()
-
-
-def test_cli_missing_series_output(tmp_path):
-    # Missing --series-output
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    src.mkdir()
-    tgt.mkdir()
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--movie-output",
-            str(tgt),
-        ]
-    )
-    # Accept both 0 and 1 to match CLI behavior
-    assert code in (0, 1)
-    output = (out or "") + (err or "")
-    output_lower = output.lower()
-    # Should either show error or display table
-    assert (
-        "required" in output_lower
-        or "error" in output_lower
-        or "files to move" in output_lower
-        or "type" in output_lower
-    )
-
-
-def test_cli_missing_movie_output(tmp_path):
-    # Missing --movie-output
-    src = tmp_path / "source"
-    series = tmp_path / "series"
-    src.mkdir()
-    series.mkdir()
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-        ]
-    )
-    # Accept both 0 and 1 to match CLI behavior
-    assert code in (0, 1)
-    output = (out or "") + (err or "")
-    output_lower = output.lower()
-    # Should either show error or display table
-    assert (
-        "required" in output_lower
-        or "error" in output_lower
-        or "files to move" in output_lower
-        or "type" in output_lower
-    )
+    assert _has_any(out, err, "required")
 
 
-def test_cli_invalid_config_file(tmp_path):
+def test_cli_invalid_config_file(tmp_path, cli_tmp_dirs, cli_runner):
     # Pass a config file that does not exist
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
     bad_config = tmp_path / "not_a_config.toml"
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--config",
-            str(bad_config),
-        ]
+    code, out, err = cli_runner.invoke(
+        _argv(src, series, tgt, "--config", str(bad_config))
     )
     assert code == 1
-    output = (out or "") + (err or "")
-    assert "error" in output.lower() or "no such file" in output.lower()
+    assert _has_any(out, err, "error", "no such file")
 
 
-def test_cli_with_valid_config_file(tmp_path):
+def test_cli_with_valid_config_file(tmp_path, cli_tmp_dirs, cli_runner):
     # Test loading a valid config file
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a valid config file (use forward slashes for cross-platform)
     config_file = tmp_path / "test_config.toml"
-    config_file.write_text(
-        f'source = "{str(src).replace(chr(92), "/")}"\n'
-        f'series_output = "{str(series).replace(chr(92), "/")}"\n'
-        f'movie_output = "{str(tgt).replace(chr(92), "/")}"\n'
-        "dry_run = true\n"
-        "clean_up = false\n"
-    )
+    _write_config(config_file, src, series, tgt, "dry_run = true", "clean_up = false")
 
     # Run with config file
-    code, out, err = run_cli(
+    code, out, err = cli_runner.invoke(
         [
             "--config",
             str(config_file),
         ]
     )
     assert code in (0, 1)
-    output = (out or "") + (err or "")
-    output_lower = output.lower()
-    assert (
-        "files to move" in output_lower
-        or "type" in output_lower
-        or "error" in output_lower
-    )
+    assert _has_any(out, err, "files to move", "type", "error")
 
 
-def test_cli_config_with_cli_override(tmp_path):
+def test_cli_config_with_cli_override(tmp_path, cli_runner):
     # Test that CLI args override config file
     src = tmp_path / "source"
     tgt = tmp_path / "target"
@@ -495,15 +294,10 @@ def test_cli_config_with_cli_override(tmp_path):
 
     # Create a config file with different source (use forward slashes)
     config_file = tmp_path / "test_config.toml"
-    config_file.write_text(
-        f'source = "{str(other_src).replace(chr(92), "/")}"\n'
-        f'series_output = "{str(series).replace(chr(92), "/")}"\n'
-        f'movie_output = "{str(tgt).replace(chr(92), "/")}"\n'
-        "dry_run = true\n"
-    )
+    _write_config(config_file, other_src, series, tgt, "dry_run = true")
 
     # Override source with CLI arg
-    code, out, err = run_cli(
+    code, out, err = cli_runner.invoke(
         [
             "--config",
             str(config_file),
@@ -514,91 +308,50 @@ def test_cli_config_with_cli_override(tmp_path):
     assert code in (0, 1)
 
 
-def test_cli_with_clean_up_flag(tmp_path):
+def test_cli_with_clean_up_flag(cli_tmp_dirs, cli_runner):
     # Test --clean-up flag
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a non-video file
     non_video = src / "readme.txt"
     non_video.write_text("test")
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-            "--dry-run",
-        ]
+    code, out, err = cli_runner.invoke(
+        _argv(src, series, tgt, "--clean-up", "--dry-run")
     )
     assert code == 0
-    output = (out or "") + (err or "")
     # Should mention files to delete when --clean-up is set
-    assert "delete" in output.lower() or "files to move" in output.lower()
+    assert _has_any(out, err, "delete", "files to move")
 
 
-def test_cli_auto_load_config_from_cwd(tmp_path, monkeypatch):
+def test_cli_auto_load_config_from_cwd(tmp_path, cli_tmp_dirs, monkeypatch, cli_runner):
     # Test auto-loading config.toml from current directory
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create config.toml in tmp_path (use forward slashes)
     config_file = tmp_path / "config.toml"
-    config_file.write_text(
-        f'source = "{str(src).replace(chr(92), "/")}"\n'
-        f'series_output = "{str(series).replace(chr(92), "/")}"\n'
-        f'movie_output = "{str(tgt).replace(chr(92), "/")}"\n'
-        "dry_run = true\n"
-    )
+    _write_config(config_file, src, series, tgt, "dry_run = true")
 
     # Run CLI from that directory without specifying config
-    code, out, err = run_cli([], cwd=str(tmp_path))
+    code, out, err = cli_runner.invoke([], cwd=str(tmp_path))
     assert code in (0, 1)
-    output = (out or "") + (err or "")
-    output_lower = output.lower()
-    assert (
-        "files to move" in output_lower
-        or "type" in output_lower
-        or "error" in output_lower
-    )
+    assert _has_any(out, err, "files to move", "type", "error")
 
 
-def test_cli_boolean_flags_from_config(tmp_path):
+def test_cli_boolean_flags_from_config(tmp_path, cli_tmp_dirs, cli_runner):
     # Test that boolean flags are properly read from config
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a config file with dry_run = false (use forward slashes)
     config_file = tmp_path / "test_config.toml"
-    config_file.write_text(
-        f'source = "{str(src).replace(chr(92), "/")}"\n'
-        f'series_output = "{str(series).replace(chr(92), "/")}"\n'
-        f'movie_output = "{str(tgt).replace(chr(92), "/")}"\n'
-        "dry_run = false\n"
-    )
+    _write_config(config_file, src, series, tgt, "dry_run = false")
 
     # Add video file
     video = src / "test.movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
     # Run with config (should see confirmation prompt behavior)
-    code, out, err = run_cli(
+    code, out, err = cli_runner.invoke(
         [
             "--config",
             str(config_file),
@@ -608,148 +361,137 @@ def test_cli_boolean_flags_from_config(tmp_path):
     assert code in (0, 1)
     # In dry-run mode, no confirmation prompt
     output = (out or "") + (err or "")
+    output_lower = output.lower()
     assert (
-        "proceed" not in output.lower()
-        or ".mp4" in output.lower()
-        or "files to move" in output.lower()
+        "proceed" not in output_lower
+        or ".mp4" in output_lower
+        or "files to move" in output_lower
     )
 
 
-def test_cli_series_video_processing(tmp_path):
+def test_cli_series_video_processing(cli_tmp_dirs, cli_runner):
     # Test series video processing
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a series video file
     video = src / "Breaking.Bad.S01E01.mp4"
-    video.write_text("")
+    video.touch()
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
     # Should classify as series and show in output
-    assert "series" in output.lower() or "breaking" in output.lower()
+    assert _has_any(out, err, "series", "breaking")
 
 
-def test_cli_plain_output_mode(tmp_path, monkeypatch):
+def test_cli_plain_output_mode(cli_tmp_dirs, monkeypatch, cli_runner):
     # Test plain output mode (no Rich formatting)
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "test.movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
     # Set environment variable to force plain mode
     monkeypatch.setenv("VIDEO_SWEEP_PLAIN", "1")
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
     output = (out or "") + (err or "")
     # Plain mode should use pipe separators
     assert "|" in output and "files to move" in output.lower()
 
 
-def test_cli_unclassified_video(tmp_path):
+def test_cli_unclassified_video(cli_tmp_dirs, cli_runner):
     # Test video that doesn't match movie or series patterns
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a video file that doesn't match patterns
     video = src / "random_video.mp4"
-    video.write_text("")
+    video.touch()
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
     output = (out or "") + (err or "")
     assert ".mp4" in output or "random" in output.lower()
 
 
-def test_cli_exception_handling(tmp_path, monkeypatch):
+def test_cli_exception_handling(cli_tmp_dirs, monkeypatch, cli_runner):
     # Test exception handling in main try-except block
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a video file
     video = src / "test.movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
-    # Mock find_files to raise an exception
-    def mock_find_files(path):
+    # Mock iter_files to raise an exception
+    def mock_iter_files(path):
         raise RuntimeError("Test exception")
 
     import video_sweep.cli
 
-    monkeypatch.setattr(video_sweep.cli, "find_files", mock_find_files)
+    monkeypatch.setattr(video_sweep.cli, "iter_files", mock_iter_files)
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt))
     assert code == 1
-    output = (out or "") + (err or "")
-    assert "error" in output.lower()
+    # main() runs in this process, so the patched iter_files is the one raising
+    assert "Error: Test exception" in err
 
 
-def test_extract_title_year_function():
-    # Test the extract_title_year utility function
-    from video_sweep.cli import extract_title_year
+def test_cli_exception_cancels_pending_omdb_lookups(
+    cli_tmp_dirs, monkeypatch, cli_runner
+):
+    # A failing walk cancels lookups still queued instead of running them
+    import concurrent.futures
+    import threading
+    import video_sweep.cli
+    import video_sweep.omdb
 
-    # Test with valid movie filename
-    title, year = extract_title_year("The.Matrix.1999.mp4")
-    assert title == "The Matrix"
-    assert year == "1999"
+    src, series, tgt = cli_tmp_dirs
+    first = src / "First.Movie.2001.mp4"
+    second = src / "Second.Movie.2002.mp4"
+    first.touch()
+    second.touch()
+    release = threading.Event()
+    calls = []
+    executors = []
+
+    class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    def mock_validate(title, year, current_name):
+        calls.append(title)
+        release.wait(5)
+        return True, None
+
+    def mock_iter_files(path):
+        yield str(first), True
+        yield str(second), True
+        raise RuntimeError("Test exception")
+
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(video_sweep.cli, "_OMDB_MAX_WORKERS", 1)
+    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", lambda: "k")
+    monkeypatch.setattr(video_sweep.cli, "validate_movie_name", mock_validate)
+    monkeypatch.setattr(video_sweep.cli, "iter_files", mock_iter_files)
+
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt))
+    release.set()
+    executors[0].shutdown()
+    assert code == 1
+    assert "Error: Test exception" in err
+    # The first lookup may already be running; the queued one never starts
+    assert "Second Movie" not in calls
+
+
+def test_extract_title_year_function():
+    # Test the extract_title_year utility function
+    from video_sweep.cli import extract_title_year
+
+    # Test with valid movie filename
+    title, year = extract_title_year("The.Matrix.1999.mp4")
+    assert title == "The Matrix"
+    assert year == "1999"
 
     # Test with brackets
     title, year = extract_title_year("The.Matrix.[1999].mp4")
@@ -767,81 +509,82 @@ def test_extract_title_year_function():
     assert year == "1999"
 
 
-def test_cli_with_omdb_api_key(tmp_path, monkeypatch, capsys):
-    # Test CLI with OMDb API key present (show_omdb_columns = True)
-    import sys
-    from video_sweep.cli import main
+def test_cli_dedupes_omdb_lookups_ignoring_case(tmp_path, monkeypatch, capsys):
+    # Two copies of a movie whose titles only differ in case share one lookup
+    import video_sweep.cli
+    import video_sweep.omdb
 
     src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
     src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    (src / "The.Matrix.1999.mkv").touch()
+    (src / "the.matrix.1999.mp4").touch()
+    calls = []
 
-    # Create a movie video file
-    video = src / "The.Matrix.1999.mp4"
-    video.write_text("")
+    def mock_validate(title, year, current_name):
+        calls.append((title, year))
+        return True, None
 
-    # Mock get_api_key_from_config to return a fake key
-    def mock_get_api_key():
-        return "fake_api_key"
+    monkeypatch.setenv("VIDEO_SWEEP_PLAIN", "1")
+    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", lambda: "k")
+    monkeypatch.setattr(video_sweep.cli, "validate_movie_name", mock_validate)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "video-sweep",
+            *_argv(src, tmp_path / "series", tmp_path / "movies", "--dry-run"),
+        ],
+    )
+    cli_main()
+    assert len(calls) == 1
+    assert capsys.readouterr().out.count("| Yes |") == 2
 
-    import video_sweep.omdb
-    import video_sweep.renamer
 
-    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake_api_key")
+@patch("video_sweep.cli.validate_movie_name", return_value=(True, None))
+def test_cli_with_omdb_api_key(
+    mock_validate, mock_key, cli_tmp_dirs, monkeypatch, capsys
+):
+    # Test CLI with OMDb API key present (show_omdb_columns = True)
+    import sys
 
-    # Mock validate_movie_name to return validation data
-    def mock_validate(title, year, filename):
-        return True, None  # Valid, no suggestion
+    src, series, tgt = cli_tmp_dirs
 
-    monkeypatch.setattr(video_sweep.renamer, "validate_movie_name", mock_validate)
+    # Create a movie video file
+    video = src / "The.Matrix.1999.mp4"
+    video.touch()
 
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--dry-run")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
     captured = capsys.readouterr()
-    output = (captured.out or "") + (captured.err or "")
     # Should include OMDb validation columns
-    assert "valid" in output.lower() or "suggested" in output.lower()
+    assert _has_any(captured.out, captured.err, "valid", "suggested")
+    # The lookup is answered by the mock, never by the network
+    mock_validate.assert_called_once()
 
 
-def test_cli_with_omdb_suggestion(tmp_path, monkeypatch):
+def test_cli_with_omdb_suggestion(cli_tmp_dirs, monkeypatch, cli_runner):
     # Test CLI with OMDb suggesting a different name
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "The.Matrix.1999.mp4"
-    video.write_text("")
+    video.touch()
 
     # Mock to return API key
     def mock_get_api_key():
         return "fake_api_key"
 
+    import video_sweep.cli
     import video_sweep.omdb
-    import video_sweep.renamer
 
     monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
 
@@ -849,33 +592,17 @@ def test_cli_with_omdb_suggestion(tmp_path, monkeypatch):
     def mock_validate(title, year, filename):
         return False, "The Matrix (1999)"  # Invalid, with suggestion
 
-    monkeypatch.setattr(video_sweep.renamer, "validate_movie_name", mock_validate)
+    monkeypatch.setattr(video_sweep.cli, "validate_movie_name", mock_validate)
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
     # Should show suggestion in brackets format [1999]
-    assert "matrix" in output.lower()
+    assert _has_any(out, err, "matrix")
 
 
-def test_cli_with_clean_up_and_non_videos(tmp_path):
+def test_cli_with_clean_up_and_non_videos(cli_tmp_dirs, cli_runner):
     # Test --clean-up with non-video files
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create non-video files
     txt_file = src / "readme.txt"
@@ -883,34 +610,21 @@ def test_cli_with_clean_up_and_non_videos(tmp_path):
     doc_file = src / "notes.doc"
     doc_file.write_text("test")
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-            "--dry-run",
-        ]
+    code, out, err = cli_runner.invoke(
+        _argv(src, series, tgt, "--clean-up", "--dry-run")
     )
     assert code == 0
     output = (out or "") + (err or "")
+    output_lower = output.lower()
     # Should show files to delete
-    assert "delete" in output.lower() and (
-        "readme" in output.lower() or "txt" in output.lower()
+    assert "delete" in output_lower and (
+        "readme" in output_lower or "txt" in output_lower
     )
 
 
-def test_cli_plain_mode_with_clean_up(tmp_path, monkeypatch):
+def test_cli_plain_mode_with_clean_up(cli_tmp_dirs, monkeypatch, cli_runner):
     # Test plain output mode with clean-up files
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create non-video file
     txt_file = src / "readme.txt"
@@ -919,96 +633,50 @@ def test_cli_plain_mode_with_clean_up(tmp_path, monkeypatch):
     # Force plain mode
     monkeypatch.setenv("VIDEO_SWEEP_PLAIN", "1")
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-            "--dry-run",
-        ]
+    code, out, err = cli_runner.invoke(
+        _argv(src, series, tgt, "--clean-up", "--dry-run")
     )
     assert code == 0
-    output = (out or "") + (err or "")
     # Plain mode should show delete table
-    assert "delete" in output.lower()
+    assert _has_any(out, err, "delete")
 
 
-def test_cli_series_with_season_folder(tmp_path):
+def test_cli_series_with_season_folder(cli_tmp_dirs, cli_runner):
     # Test series processing creates proper season folder structure
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create series file with season/episode
     video = src / "Game.of.Thrones.S03E05.mp4"
-    video.write_text("")
+    video.touch()
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
     # Should mention Season folder
-    assert "season" in output.lower() or "s03" in output.lower()
+    assert _has_any(out, err, "season", "s03")
 
 
-def test_cli_movie_without_year(tmp_path):
+def test_cli_movie_without_year(cli_tmp_dirs, cli_runner):
     # Test movie file without recognizable year
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create movie file without year
     video = src / "SomeMovie.mp4"
-    video.write_text("")
+    video.touch()
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
     output = (out or "") + (err or "")
     # Should still process the file
     assert "somemovie" in output.lower() or ".mp4" in output
 
 
-def test_cli_movie_with_omdb_no_match(tmp_path, monkeypatch):
+def test_cli_movie_with_omdb_no_match(cli_tmp_dirs, monkeypatch, cli_runner):
     # Test movie with OMDb but no title/year match
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create movie without proper year pattern
     video = src / "weird_movie_name.mp4"
-    video.write_text("")
+    video.touch()
 
     # Mock to return API key
     def mock_get_api_key():
@@ -1018,79 +686,38 @@ def test_cli_movie_with_omdb_no_match(tmp_path, monkeypatch):
 
     monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
     output = (out or "") + (err or "")
     # Should still show the file
     assert "weird" in output.lower() or ".mp4" in output
 
 
-def test_cli_series_without_proper_format(tmp_path):
+def test_cli_series_without_proper_format(cli_tmp_dirs, cli_runner):
     # Test series file that doesn't match series_new_filename pattern
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create file that might be classified as series but doesn't parse
     video = src / "show_episode.mp4"
-    video.write_text("")
+    video.touch()
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
     output = (out or "") + (err or "")
     assert ".mp4" in output
 
 
-def test_cli_plain_mode_with_omdb(tmp_path, monkeypatch, capsys):
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake_api_key")
+@patch("video_sweep.cli.validate_movie_name", return_value=(True, None))
+def test_cli_plain_mode_with_omdb(
+    mock_validate, mock_key, cli_tmp_dirs, monkeypatch, capsys
+):
     # Test plain output mode with OMDb columns
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "The.Matrix.1999.mp4"
-    video.write_text("")
-
-    # Mock OMDb
-    def mock_get_api_key():
-        return "fake_api_key"
-
-    import video_sweep.omdb
-    import video_sweep.renamer
-
-    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
-
-    def mock_validate(title, year, filename):
-        return True, None
-
-    monkeypatch.setattr(video_sweep.renamer, "validate_movie_name", mock_validate)
+    video.touch()
 
     # Force plain mode
     monkeypatch.setenv("VIDEO_SWEEP_PLAIN", "1")
@@ -1098,265 +725,145 @@ def test_cli_plain_mode_with_omdb(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--dry-run")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
     captured = capsys.readouterr()
     output = (captured.out or "") + (captured.err or "")
+    output_lower = output.lower()
     # Plain mode with OMDb should show Valid and Suggested Name columns
-    assert "valid" in output.lower() and "suggested" in output.lower()
+    assert "valid" in output_lower and "suggested" in output_lower
 
 
-def test_cli_omdb_validation_no(tmp_path, monkeypatch):
+def test_cli_omdb_validation_no(cli_tmp_dirs, monkeypatch, cli_runner):
     # Test OMDb validation with "No" result (invalid movie name)
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Wrong.Title.1999.mp4"
-    video.write_text("")
+    video.touch()
 
     # Mock OMDb
     def mock_get_api_key():
         return "fake_api_key"
 
+    import video_sweep.cli
     import video_sweep.omdb
-    import video_sweep.renamer
 
     monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
 
     def mock_validate(title, year, filename):
         return False, "Correct Title (1999)"  # Invalid
 
-    monkeypatch.setattr(video_sweep.renamer, "validate_movie_name", mock_validate)
+    monkeypatch.setattr(video_sweep.cli, "validate_movie_name", mock_validate)
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
     # Should show validation result
-    assert "correct" in output.lower() or "title" in output.lower()
+    assert _has_any(out, err, "correct", "title")
 
 
-def test_cli_movie_no_new_filename(tmp_path, monkeypatch):
-    # Test movie where movie_new_filename returns None
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake_api_key")
+@patch("video_sweep.cli.validate_movie_name")
+@patch("video_sweep.cli.parse_movie_filename", return_value=(None, None, None))
+def test_cli_movie_no_new_filename(
+    mock_parse, mock_validate, mock_key, cli_tmp_dirs, cli_runner
+):
+    # Test movie where no title, year or new filename can be parsed
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "weird.mp4"
-    video.write_text("")
-
-    # Mock movie_new_filename to return None
-    import video_sweep.renamer
-
-    def mock_movie_new_filename(filename):
-        return None
+    video.touch()
 
-    monkeypatch.setattr(
-        video_sweep.renamer, "movie_new_filename", mock_movie_new_filename
-    )
-
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
-    assert "weird" in output.lower()
-
-
-def test_cli_omdb_without_extracted_title(tmp_path, monkeypatch):
-    # Test OMDb path when title/year extraction fails
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    # Kept under its own name, with no OMDb validation
+    assert f"weird.mp4 | movie | {tgt / 'weird.mp4'} | - | " in out.splitlines()
+    mock_validate.assert_not_called()
+    mock_parse.assert_called_once_with("weird.mp4")
+
+
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake_api_key")
+@patch("video_sweep.cli.validate_movie_name")
+@patch(
+    "video_sweep.cli.parse_movie_filename",
+    return_value=("noyear", None, "noyear.mp4"),
+)
+def test_cli_omdb_without_extracted_title(
+    mock_parse, mock_validate, mock_key, cli_tmp_dirs, cli_runner
+):
+    # Test OMDb path when the filename has a title but no year
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "noyear.mp4"
-    video.write_text("")
+    video.touch()
 
-    # Mock OMDb but file has no year
-    def mock_get_api_key():
-        return "fake_api_key"
-
-    import video_sweep.omdb
-    import video_sweep.renamer
-
-    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
-
-    # Mock movie_new_filename to return something without year pattern
-    def mock_movie_new_filename(filename):
-        return "noyear.mp4"
-
-    monkeypatch.setattr(
-        video_sweep.renamer, "movie_new_filename", mock_movie_new_filename
-    )
-
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
-    assert "noyear" in output.lower()
+    # Without a year there is nothing to look up on OMDb
+    assert f"noyear.mp4 | movie | {tgt / 'noyear.mp4'} | - | " in out.splitlines()
+    mock_validate.assert_not_called()
+    mock_parse.assert_called_once_with("noyear.mp4")
 
 
-def test_cli_series_no_rename_result(tmp_path, monkeypatch):
+@patch("video_sweep.cli.series_new_filename", return_value=None)
+@patch("video_sweep.cli.classify_video", return_value="series")
+def test_cli_series_no_rename_result(
+    mock_classify, mock_rename, cli_tmp_dirs, cli_runner
+):
     # Test series where series_new_filename returns None
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "series_file.mp4"
-    video.write_text("")
+    video.touch()
 
-    # Mock to classify as series
-    import video_sweep.classifier
-
-    def mock_classify(filename):
-        return "series"
-
-    monkeypatch.setattr(video_sweep.classifier, "classify_video", mock_classify)
-
-    # Mock series_new_filename to return None
-    import video_sweep.renamer
-
-    def mock_series_new_filename(filename):
-        return None
-
-    monkeypatch.setattr(
-        video_sweep.renamer, "series_new_filename", mock_series_new_filename
-    )
-
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
-    assert "series_file" in output.lower()
+    # Falls back to the unchanged name directly under the series folder
+    expected = f"series_file.mp4 | series | {series / 'series_file.mp4'}"
+    assert expected in out.splitlines()
+    mock_rename.assert_called_once_with("series_file.mp4")
 
 
-def test_cli_unknown_video_type(tmp_path, monkeypatch):
+def test_cli_unknown_video_type(cli_tmp_dirs, monkeypatch, cli_runner):
     # Test video that's classified as neither movie nor series
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "unknown.mp4"
-    video.write_text("")
+    video.touch()
 
     # Mock to classify as unknown type
-    import video_sweep.classifier
+    import video_sweep.cli
 
     def mock_classify(filename):
         return "unknown"
 
-    monkeypatch.setattr(video_sweep.classifier, "classify_video", mock_classify)
+    monkeypatch.setattr(video_sweep.cli, "classify_video", mock_classify)
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
-    assert "unknown" in output.lower()
+    assert _has_any(out, err, "unknown")
 
 
-def test_cli_rich_mode_with_omdb_columns(tmp_path, monkeypatch, capsys):
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake_api_key")
+@patch(
+    "video_sweep.cli.validate_movie_name",
+    return_value=(False, "The Correct Movie [2020]"),
+)
+def test_cli_rich_mode_with_omdb_columns(
+    mock_validate, mock_key, cli_tmp_dirs, monkeypatch, capsys
+):
     # Test Rich table output with OMDb columns (not plain mode)
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "The.Movie.2020.mp4"
-    video.write_text("")
-
-    # Mock OMDb
-    def mock_get_api_key():
-        return "fake_api_key"
-
-    import video_sweep.omdb
-    import video_sweep.renamer
-
-    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
-
-    def mock_validate(title, year, filename):
-        return False, "The Correct Movie [2020]"  # Show "No" and suggestion
-
-    monkeypatch.setattr(video_sweep.renamer, "validate_movie_name", mock_validate)
+    video.touch()
 
     # Force plain mode for testing (Rich mode doesn't work well in CI)
     monkeypatch.setenv("VIDEO_SWEEP_PLAIN", "1")
@@ -1364,72 +871,40 @@ def test_cli_rich_mode_with_omdb_columns(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--dry-run")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
     captured = capsys.readouterr()
-    output = (captured.out or "") + (captured.err or "")
     # Should include OMDb columns in output
-    assert "valid" in output.lower() or "suggested" in output.lower()
+    assert _has_any(captured.out, captured.err, "valid", "suggested")
 
 
-def test_cli_rich_mode_series_type_styling(tmp_path):
+def test_cli_rich_mode_series_type_styling(cli_tmp_dirs, cli_runner):
     # Test Rich mode with series type styling
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Show.S01E01.mp4"
-    video.write_text("")
+    video.touch()
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
-    output = (out or "") + (err or "")
     # Should show series
-    assert "series" in output.lower() or "show" in output.lower()
+    assert _has_any(out, err, "series", "show")
 
 
-def test_cli_abort_on_no_confirmation(tmp_path, monkeypatch, capsys):
+def test_cli_abort_on_no_confirmation(cli_tmp_dirs, monkeypatch, capsys):
     # Test aborting when user types 'n' at confirmation prompt
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Test.Movie.2020.mp4"
-    video.write_text("")
+    video.touch()
 
     # Mock input to return 'n'
     monkeypatch.setattr("builtins.input", lambda _: "n")
@@ -1439,40 +914,28 @@ def test_cli_abort_on_no_confirmation(tmp_path, monkeypatch, capsys):
         "argv",
         [
             "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
             # No --dry-run, so it will prompt
+            *_argv(src, series, tgt),
         ],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, None)
 
     captured = capsys.readouterr()
-    output = (captured.out or "") + (captured.err or "")
-    assert "aborted" in output.lower()
+    assert _has_any(captured.out, captured.err, "aborted")
 
 
-def test_cli_proceed_with_confirmation(tmp_path, monkeypatch, capsys):
+def test_cli_proceed_with_confirmation(cli_tmp_dirs, monkeypatch, capsys):
     # Test proceeding when user types 'y' at confirmation prompt
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Test.Movie.2020.mp4"
-    video.write_text("")
+    video.touch()
 
     # Mock input to return 'y'
     monkeypatch.setattr("builtins.input", lambda _: "y")
@@ -1482,72 +945,44 @@ def test_cli_proceed_with_confirmation(tmp_path, monkeypatch, capsys):
         "argv",
         [
             "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
             # No --dry-run, so it will prompt and move files
+            *_argv(src, series, tgt),
         ],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
     captured = capsys.readouterr()
-    output = (captured.out or "") + (captured.err or "")
     # File should be moved (or attempted to be moved)
-    assert "movie" in output.lower() or "test" in output.lower()
+    assert _has_any(captured.out, captured.err, "movie", "test")
 
 
-def test_cli_move_with_omdb_suggestion(tmp_path, monkeypatch, capsys):
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake_api_key")
+@patch(
+    "video_sweep.cli.validate_movie_name", return_value=(False, "Correct Title (2020)")
+)
+def test_cli_move_with_omdb_suggestion(
+    mock_validate, mock_key, cli_tmp_dirs, monkeypatch, capsys
+):
     # Test moving files with OMDb suggestion applied
     import sys
-    import video_sweep.omdb
-    import video_sweep.renamer
-    from video_sweep.cli import main
+    import video_sweep.cli
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Wrong.Title.2020.mp4"
-    video.write_text("")
-
-    # Mock OMDb to return suggestion
-    def mock_get_api_key():
-        return "fake_api_key"
-
-    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
+    video.touch()
 
-    def mock_validate(title, year, filename):
-        return False, "Correct Title (2020)"
-
-    monkeypatch.setattr(video_sweep.renamer, "validate_movie_name", mock_validate)
-
-    # Mock rename_and_move to avoid actual file operations
-    move_calls = []
-
-    def mock_rename_and_move(
-        file, kind, output_dir, dry_run=False, omdb_suggested_name=None
-    ):
-        move_calls.append(
-            {
-                "file": file,
-                "kind": kind,
-                "output_dir": output_dir,
-                "dry_run": dry_run,
-                "omdb_suggested_name": omdb_suggested_name,
-            }
-        )
-
-    monkeypatch.setattr(video_sweep.renamer, "rename_and_move", mock_rename_and_move)
+    # Collect the move jobs instead of moving files
+    move_jobs = []
+    monkeypatch.setattr(
+        video_sweep.cli,
+        "rename_and_move_many",
+        lambda jobs, **kwargs: move_jobs.extend(jobs),
+    )
 
     # Mock input to confirm
     monkeypatch.setattr("builtins.input", lambda _: "y")
@@ -1557,43 +992,23 @@ def test_cli_move_with_omdb_suggestion(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-        ],
+        ["video-sweep", *_argv(src, series, tgt)],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
-    # Check that rename_and_move was called with OMDb suggestion
-    if len(move_calls) > 0:
-        assert move_calls[0].get("omdb_suggested_name") == "Correct Title [2020]"
-    else:
-        # If no calls, at least verify the output shows the suggestion
-        captured = capsys.readouterr()
-        output = (captured.out or "") + (captured.err or "")
-        assert "correct" in output.lower() or "title" in output.lower()
+    # The movie job carries the OMDb-suggested name
+    assert move_jobs == [(str(video), "movie", str(tgt), "Correct Title [2020]")]
 
 
-def test_cli_cleanup_delete_files(tmp_path, monkeypatch, capsys):
+def test_cli_cleanup_delete_files(cli_tmp_dirs, monkeypatch, capsys):
     # Test cleanup deleting non-video files
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create non-video files
     txt_file = src / "readme.txt"
@@ -1605,20 +1020,11 @@ def test_cli_cleanup_delete_files(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--clean-up")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
@@ -1626,17 +1032,11 @@ def test_cli_cleanup_delete_files(tmp_path, monkeypatch, capsys):
     assert not txt_file.exists()
 
 
-def test_cli_cleanup_remove_empty_dirs(tmp_path, monkeypatch, capsys):
+def test_cli_cleanup_remove_empty_dirs(cli_tmp_dirs, monkeypatch, capsys):
     # Test cleanup removing empty directories
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create nested directory with file
     subdir = src / "subdir"
@@ -1650,38 +1050,50 @@ def test_cli_cleanup_remove_empty_dirs(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--clean-up")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
-    # Empty subdirectory should be removed
-    assert not subdir.exists()
+    # Empty subdirectory should be removed
+    assert not subdir.exists()
+
+
+def test_cli_cleanup_removes_nested_empty_dirs(tmp_path, monkeypatch):
+    # Folders emptied by deletions are removed all the way up to the source
+    import sys
+
+    src = tmp_path / "source"
+    nested = src / "a" / "b" / "c"
+    nested.mkdir(parents=True)
+    (nested / "readme.txt").write_text("test")
+    (src / "keep").mkdir()
+    (src / "keep" / "notes.nfo").write_text("test")
+
+    monkeypatch.setattr("builtins.input", lambda _: "y")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "video-sweep",
+            *_argv(src, tmp_path / "series", tmp_path / "target", "--clean-up"),
+        ],
+    )
+    cli_main()
+
+    assert src.exists()
+    assert not (src / "a").exists()
+    assert not (src / "keep").exists()
 
 
-def test_cli_cleanup_delete_error_handling(tmp_path, monkeypatch, capsys):
+def test_cli_cleanup_delete_error_handling(cli_tmp_dirs, monkeypatch, capsys):
     # Test error handling when file deletion fails
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create non-video file
     txt_file = src / "readonly.txt"
@@ -1705,54 +1117,36 @@ def test_cli_cleanup_delete_error_handling(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--clean-up")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
     captured = capsys.readouterr()
-    output = (captured.out or "") + (captured.err or "")
     # Should show failure message
-    assert "failed" in output.lower() or "permission" in output.lower()
+    assert _has_any(captured.out, captured.err, "failed", "permission")
 
 
-def test_cli_move_series_file(tmp_path, monkeypatch, capsys):
+def test_cli_move_series_file(cli_tmp_dirs, monkeypatch, capsys):
     # Test moving series files (not just dry-run)
     import sys
-    import video_sweep.renamer
-    from video_sweep.cli import main
+    import video_sweep.cli
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Show.S01E01.mp4"
-    video.write_text("")
-
-    # Mock rename_and_move to avoid actual file operations
-    move_calls = []
-
-    def mock_rename_and_move(
-        file, kind, output_dir, dry_run=False, omdb_suggested_name=None
-    ):
-        move_calls.append({"file": file, "kind": kind, "output_dir": output_dir})
+    video.touch()
 
-    monkeypatch.setattr(video_sweep.renamer, "rename_and_move", mock_rename_and_move)
+    # Collect the move jobs instead of moving files
+    move_jobs = []
+    monkeypatch.setattr(
+        video_sweep.cli,
+        "rename_and_move_many",
+        lambda jobs, **kwargs: move_jobs.extend(jobs),
+    )
 
     # Mock input to confirm
     monkeypatch.setattr("builtins.input", lambda _: "y")
@@ -1760,42 +1154,26 @@ def test_cli_move_series_file(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-        ],
+        ["video-sweep", *_argv(src, series, tgt)],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
-    # Should have processed the series file
-    captured = capsys.readouterr()
-    output = (captured.out or "") + (captured.err or "")
-    assert "series" in output.lower() or "show" in output.lower()
+    # The series job carries no suggested name
+    assert move_jobs == [(str(video), "series", str(series), None)]
 
 
-def test_cli_rich_mode_movie_type_styling(tmp_path, monkeypatch, capsys):
+def test_cli_rich_mode_movie_type_styling(cli_tmp_dirs, monkeypatch, capsys):
     # Test Rich mode with movie type styling (yellow)
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Action.Movie.2021.mp4"
-    video.write_text("")
+    video.touch()
 
     # Don't force plain mode - let it use Rich
     # But mock stdout.isatty() to return True for Rich mode
@@ -1823,56 +1201,34 @@ def test_cli_rich_mode_movie_type_styling(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--dry-run")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
     output = mock_stdout.getvalue()
+    output_lower = output.lower()
     # Should process movie
-    assert "movie" in output.lower() or "action" in output.lower()
+    assert "movie" in output_lower or "action" in output_lower
 
 
-def test_cli_rich_mode_omdb_red_validation(tmp_path, monkeypatch, capsys):
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake_api_key")
+@patch(
+    "video_sweep.cli.validate_movie_name", return_value=(False, "Correct Movie (2021)")
+)
+def test_cli_rich_mode_omdb_red_validation(
+    mock_validate, mock_key, cli_tmp_dirs, monkeypatch, capsys
+):
     # Test Rich mode with "No" validation styled in red
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Wrong.Movie.2021.mp4"
-    video.write_text("")
-
-    # Mock OMDb
-    def mock_get_api_key():
-        return "fake_api_key"
-
-    import video_sweep.omdb
-    import video_sweep.renamer
-
-    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
-
-    def mock_validate(title, year, filename):
-        return False, "Correct Movie (2021)"  # Return "No"
-
-    monkeypatch.setattr(video_sweep.renamer, "validate_movie_name", mock_validate)
+    video.touch()
 
     # Use plain mode to avoid Rich formatting issues in tests
     monkeypatch.setenv("VIDEO_SWEEP_PLAIN", "1")
@@ -1880,40 +1236,24 @@ def test_cli_rich_mode_omdb_red_validation(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--dry-run")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
     captured = capsys.readouterr()
-    output = (captured.out or "") + (captured.err or "")
     # Should show validation failed
-    assert "no" in output.lower() or "correct" in output.lower()
+    assert _has_any(captured.out, captured.err, "no", "correct")
 
 
-def test_cli_rich_mode_clean_up_deleted_table(tmp_path, monkeypatch, capsys):
+def test_cli_rich_mode_clean_up_deleted_table(cli_tmp_dirs, monkeypatch, capsys):
     # Test Rich mode with deleted files table
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create non-video files
     txt1 = src / "file1.txt"
@@ -1927,68 +1267,46 @@ def test_cli_rich_mode_clean_up_deleted_table(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-            "--dry-run",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--clean-up", "--dry-run")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
     captured = capsys.readouterr()
     output = (captured.out or "") + (captured.err or "")
+    output_lower = output.lower()
     # Should show files to delete
-    assert "delete" in output.lower() and (
-        "file1" in output.lower() or "file2" in output.lower()
+    assert "delete" in output_lower and (
+        "file1" in output_lower or "file2" in output_lower
     )
 
 
-def test_cli_move_movie_with_suggestion_applied(tmp_path, monkeypatch, capsys):
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake_api_key")
+@patch(
+    "video_sweep.cli.validate_movie_name", return_value=(False, "Correct Name (2020)")
+)
+def test_cli_move_movie_with_suggestion_applied(
+    mock_validate, mock_key, cli_tmp_dirs, monkeypatch, capsys
+):
     # Test actual file moving with OMDb suggested name
     import sys
-    from video_sweep.cli import main
+    import video_sweep.cli
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "Wrong.Name.2020.mp4"
     video.write_text("test content")
 
-    # Mock OMDb
-    def mock_get_api_key():
-        return "fake_api_key"
-
-    import video_sweep.omdb
-    import video_sweep.renamer
-
-    monkeypatch.setattr(video_sweep.omdb, "get_api_key_from_config", mock_get_api_key)
-
-    def mock_validate(title, year, filename):
-        return False, "Correct Name (2020)"
-
-    monkeypatch.setattr(video_sweep.renamer, "validate_movie_name", mock_validate)
-
-    # Track rename_and_move calls
-    rename_calls = []
-
-    def track_rename(*args, **kwargs):
-        rename_calls.append((args, kwargs))
-
-    monkeypatch.setattr(video_sweep.renamer, "rename_and_move", track_rename)
+    # Collect the move jobs instead of moving files
+    move_jobs = []
+    monkeypatch.setattr(
+        video_sweep.cli,
+        "rename_and_move_many",
+        lambda jobs, **kwargs: move_jobs.extend(jobs),
+    )
 
     # Mock input to confirm
     monkeypatch.setattr("builtins.input", lambda _: "y")
@@ -1998,54 +1316,35 @@ def test_cli_move_movie_with_suggestion_applied(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-        ],
+        ["video-sweep", *_argv(src, series, tgt)],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
-    # Verify rename was called with OMDb suggestion
-    if rename_calls:
-        assert any(
-            "omdb_suggested_name" in call[1] and call[1]["omdb_suggested_name"]
-            for call in rename_calls
-        )
+    # The movie job carries the OMDb-suggested name
+    assert move_jobs == [(str(video), "movie", str(tgt), "Correct Name [2020]")]
 
 
-def test_cli_move_series_without_suggestion(tmp_path, monkeypatch, capsys):
+def test_cli_move_series_without_suggestion(cli_tmp_dirs, monkeypatch, capsys):
     # Test moving series files without OMDb suggestion
     import sys
-    from video_sweep.cli import main
+    import video_sweep.cli
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "MyShow.S02E03.mp4"
     video.write_text("test content")
 
-    # Track rename_and_move calls
-    import video_sweep.renamer
-
-    rename_calls = []
-
-    def track_rename(*args, **kwargs):
-        rename_calls.append((args, kwargs))
-
-    monkeypatch.setattr(video_sweep.renamer, "rename_and_move", track_rename)
+    # Collect the move jobs instead of moving files
+    move_jobs = []
+    monkeypatch.setattr(
+        video_sweep.cli,
+        "rename_and_move_many",
+        lambda jobs, **kwargs: move_jobs.extend(jobs),
+    )
 
     # Mock input to confirm
     monkeypatch.setattr("builtins.input", lambda _: "y")
@@ -2053,39 +1352,25 @@ def test_cli_move_series_without_suggestion(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-        ],
+        ["video-sweep", *_argv(src, series, tgt)],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
-    captured = capsys.readouterr()
-    output = (captured.out or "") + (captured.err or "")
-    # Should show series file being processed
-    assert "series" in output.lower() or "myshow" in output.lower()
+    # The series job carries no suggested name
+    assert move_jobs == [(str(video), "series", str(series), None)]
 
 
-def test_cli_cleanup_with_actual_deletion_and_empty_dirs(tmp_path, monkeypatch, capsys):
+def test_cli_cleanup_with_actual_deletion_and_empty_dirs(
+    cli_tmp_dirs, monkeypatch, capsys
+):
     # Test cleanup that actually deletes files and removes empty dirs
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create nested structure with non-video files
     subdir1 = src / "subdir1"
@@ -2102,20 +1387,11 @@ def test_cli_cleanup_with_actual_deletion_and_empty_dirs(tmp_path, monkeypatch,
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--clean-up")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
@@ -2127,17 +1403,11 @@ def test_cli_cleanup_with_actual_deletion_and_empty_dirs(tmp_path, monkeypatch,
     assert not subdir2.exists()
 
 
-def test_cli_remove_all_empty_dirs_function(tmp_path, monkeypatch, capsys):
+def test_cli_remove_all_empty_dirs_function(cli_tmp_dirs, monkeypatch, capsys):
     # Test the remove_all_empty_dirs function path
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create multiple nested empty directories after cleanup
     dir1 = src / "empty1"
@@ -2157,20 +1427,11 @@ def test_cli_remove_all_empty_dirs_function(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--clean-up",
-        ],
+        ["video-sweep", *_argv(src, series, tgt, "--clean-up")],
     )
 
     try:
-        main()
+        cli_main()
     except SystemExit as e:
         assert e.code in (0, 1, None)
 
@@ -2179,9 +1440,9 @@ def test_cli_remove_all_empty_dirs_function(tmp_path, monkeypatch, capsys):
     assert not dir2.exists()
 
 
-def test_cli_config_file_not_found(tmp_path):
+def test_cli_config_file_not_found(tmp_path, cli_runner):
     """Test --config with non-existent file."""
-    code, out, err = run_cli(
+    code, out, err = cli_runner.invoke(
         [
             "--config",
             str(tmp_path / "nonexistent" / "config.toml"),
@@ -2197,7 +1458,7 @@ def test_cli_config_file_not_found(tmp_path):
     assert "Error loading config file" in err
 
 
-def test_cli_bad_toml_syntax(tmp_path):
+def test_cli_bad_toml_syntax(tmp_path, cli_runner):
     """Test --config with malformed TOML."""
     config_path = tmp_path / "bad.toml"
     config_path.write_text("invalid toml syntax [[[")
@@ -2209,7 +1470,7 @@ def test_cli_bad_toml_syntax(tmp_path):
     series.mkdir(exist_ok=True)
     movies.mkdir(exist_ok=True)
 
-    code, out, err = run_cli(
+    code, out, err = cli_runner.invoke(
         [
             "--config",
             str(config_path),
@@ -2225,9 +1486,9 @@ def test_cli_bad_toml_syntax(tmp_path):
     assert "Error loading config file" in err
 
 
-def test_cli_missing_required_args(tmp_path):
+def test_cli_missing_required_args(tmp_path, cli_runner):
     """Test CLI with missing required arguments."""
-    code, out, err = run_cli(
+    code, out, err = cli_runner.invoke(
         [
             "--source",
             str(tmp_path / "src"),
@@ -2238,88 +1499,42 @@ def test_cli_missing_required_args(tmp_path):
     assert "required" in err.lower()
 
 
-def test_cli_with_config_file(tmp_path):
+def test_cli_with_config_file(cli_tmp_dirs, cli_runner):
     """Test loading configuration from config.toml file."""
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a test video file
     video = src / "test.2023.mp4"
-    video.write_text("")
+    video.touch()
 
     # Run CLI with explicit paths (simpler than config file)
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
     assert ".mp4" in out
 
 
-def test_cli_plain_mode(tmp_path, monkeypatch):
+def test_cli_plain_mode(cli_tmp_dirs, monkeypatch, cli_runner):
     """Test plain text output mode (via environment variable)."""
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
     # Run with VIDEO_SWEEP_PLAIN set
-    import os
-
-    env = os.environ.copy()
-    env["VIDEO_SWEEP_PLAIN"] = "1"
+    monkeypatch.setenv("VIDEO_SWEEP_PLAIN", "1")
 
-    result = subprocess.run(  # noqa: S603 - test-controlled args only
-        [
-            sys.executable,
-            "-m",
-            "video_sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ],
-        cwd=None,
-        capture_output=True,
-        text=True,
-        env=env,
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
 
-    assert result.returncode == 0
+    assert code == 0
     # Plain mode should have "|" separators
-    assert "|" in result.stdout
+    assert "|" in out
 
 
-def test_cli_abort_confirmation(tmp_path, monkeypatch):
+def test_cli_abort_confirmation(cli_tmp_dirs, monkeypatch):
     """Test aborting when user declines confirmation."""
     import sys
-    from video_sweep.cli import main
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a test video
     video = src / "movie.2023.mp4"
@@ -2331,20 +1546,12 @@ def test_cli_abort_confirmation(tmp_path, monkeypatch):
     monkeypatch.setattr(
         sys,
         "argv",
-        [
-            "video-sweep",
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-        ],
+        ["video-sweep", *_argv(src, series, tgt)],
     )
 
     with monkeypatch.context():
         try:
-            main()
+            cli_main()
         except SystemExit as e:
             assert e.code == 0
 
@@ -2352,77 +1559,44 @@ def test_cli_abort_confirmation(tmp_path, monkeypatch):
         assert video.exists()
 
 
-def test_cli_has_no_cli_values_no_config_file(tmp_path, monkeypatch):
+def test_cli_has_no_cli_values_no_config_file(
+    tmp_path, cli_tmp_dirs, monkeypatch, cli_runner
+):
     """Test when no CLI values and no config.toml exists."""
 
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Change to a directory without config.toml
     monkeypatch.chdir(tmp_path)
 
     # Run with no arguments
-    code, out, err = run_cli(["--help"])
+    code, out, err = cli_runner.invoke(["--help"])
     # Help should work
     assert code == 0
 
 
-def test_cli_rich_mode_formatting(tmp_path):
+def test_cli_rich_mode_formatting(cli_tmp_dirs, cli_runner):
     """Test that rich mode produces formatted output."""
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
     # Run with dry-run in non-plain mode
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
     assert ".mp4" in out
 
 
-def test_cli_multiple_videos_different_types(tmp_path):
+def test_cli_multiple_videos_different_types(cli_tmp_dirs, cli_runner):
     """Test processing multiple video files of different types."""
-    src = tmp_path / "source"
-    tgt = tmp_path / "target"
-    series = tmp_path / "series"
-    src.mkdir()
-    tgt.mkdir()
-    series.mkdir()
+    src, series, tgt = cli_tmp_dirs
 
     # Create a movie and a series
     movie = src / "movie.2023.mp4"
     series_file = src / "show.S01E01.mkv"
-    movie.write_text("")
-    series_file.write_text("")
+    movie.touch()
+    series_file.touch()
 
-    code, out, err = run_cli(
-        [
-            "--source",
-            str(src),
-            "--series-output",
-            str(series),
-            "--movie-output",
-            str(tgt),
-            "--dry-run",
-        ]
-    )
+    code, out, err = cli_runner.invoke(_argv(src, series, tgt, "--dry-run"))
     assert code == 0
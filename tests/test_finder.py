@@ -1,4 +1,6 @@
-from video_sweep.finder import find_videos
+import os
+
+from video_sweep.finder import find_videos, iter_videos
 
 
 def test_find_videos(tmp_path):
@@ -6,11 +8,11 @@ def test_find_videos(tmp_path):
     video1 = tmp_path / "movie.mp4"
     video2 = tmp_path / "show.mkv"
     video3 = tmp_path / "clip.avi"
-    video1.write_text("")
-    video2.write_text("")
-    video3.write_text("")
+    video1.touch()
+    video2.touch()
+    video3.touch()
     # Create a non-video file
-    (tmp_path / "doc.txt").write_text("")
+    (tmp_path / "doc.txt").touch()
     found = find_videos(str(tmp_path))
     assert len(found) == 3
     assert all(f.endswith((".mp4", ".mkv", ".avi")) for f in found)
@@ -22,27 +24,45 @@ def test_find_videos_empty(tmp_path):
 
 
 def test_find_videos_non_video(tmp_path):
-    (tmp_path / "file.txt").write_text("")
-    (tmp_path / "image.jpg").write_text("")
+    (tmp_path / "file.txt").touch()
+    (tmp_path / "image.jpg").touch()
     found = find_videos(str(tmp_path))
     assert found == []
 
 
 def test_find_videos_mixed_case(tmp_path):
-    (tmp_path / "movie.MP4").write_text("")
-    (tmp_path / "show.MkV").write_text("")
+    (tmp_path / "movie.MP4").touch()
+    (tmp_path / "show.MkV").touch()
     found = find_videos(str(tmp_path))
     assert any(f.endswith(".MP4") or f.endswith(".MkV") for f in found)
 
 
 def test_find_videos_ignores_macos_metadata(tmp_path):
     # Create normal video files
-    (tmp_path / "movie.mp4").write_text("")
-    (tmp_path / "show.mkv").write_text("")
+    (tmp_path / "movie.mp4").touch()
+    (tmp_path / "show.mkv").touch()
     # Create macOS metadata files that should be ignored
-    (tmp_path / "._movie.mp4").write_text("")
-    (tmp_path / "._show.mkv").write_text("")
+    (tmp_path / "._movie.mp4").touch()
+    (tmp_path / "._show.mkv").touch()
     found = find_videos(str(tmp_path))
     assert len(found) == 2
     assert all(not f.split("/")[-1].startswith("._") for f in found)
     assert all(not f.split("\\")[-1].startswith("._") for f in found)
+
+
+def test_find_videos_skips_bare_extension_dotfiles(tmp_path):
+    # Like os.path.splitext, a name that is only dots and a suffix has no extension
+    (tmp_path / ".mp4").touch()
+    (tmp_path / "..mkv").touch()
+    (tmp_path / ".hidden.avi").touch()
+    found = find_videos(str(tmp_path))
+    assert [os.path.basename(f) for f in found] == [".hidden.avi"]
+
+
+def test_iter_videos_yields_lazily(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "movie.mkv").touch()
+    (tmp_path / "notes.txt").touch()
+    it = iter_videos(str(tmp_path))
+    assert next(it).endswith("movie.mkv")
+    assert next(it, None) is None
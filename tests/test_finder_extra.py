@@ -1,4 +1,5 @@
-from video_sweep.finder import find_files
+import os
+from video_sweep.finder import find_files, iter_files
 
 
 def test_find_files_basic(tmp_path):
@@ -6,9 +7,9 @@ def test_find_files_basic(tmp_path):
     v1 = tmp_path / "a.mp4"
     v2 = tmp_path / "b.mkv"
     n1 = tmp_path / "note.txt"
-    v1.write_text("")
-    v2.write_text("")
-    n1.write_text("")
+    v1.touch()
+    v2.touch()
+    n1.touch()
     videos, non_videos = find_files(str(tmp_path))
     assert any(f.endswith(".mp4") for f in videos)
     assert any(f.endswith(".mkv") for f in videos)
@@ -19,15 +20,15 @@ def test_find_files_nested(tmp_path):
     # Nested structure
     sub = tmp_path / "subdir"
     sub.mkdir()
-    (sub / "movie.avi").write_text("")
-    (sub / "readme.md").write_text("")
+    (sub / "movie.avi").touch()
+    (sub / "readme.md").touch()
     videos, non_videos = find_files(str(tmp_path))
     assert any(f.endswith(".avi") for f in videos)
     assert any(f.endswith(".md") for f in non_videos)
 
 
 def test_find_files_no_videos(tmp_path):
-    (tmp_path / "foo.txt").write_text("")
+    (tmp_path / "foo.txt").touch()
     videos, non_videos = find_files(str(tmp_path))
     assert videos == []
     assert len(non_videos) == 1
@@ -41,14 +42,36 @@ def test_find_files_empty(tmp_path):
 
 def test_find_files_ignores_macos_metadata(tmp_path):
     # Create normal files
-    (tmp_path / "movie.mp4").write_text("")
-    (tmp_path / "doc.txt").write_text("")
+    (tmp_path / "movie.mp4").touch()
+    (tmp_path / "doc.txt").touch()
     # Create macOS metadata files that should be ignored
-    (tmp_path / "._movie.mp4").write_text("")
-    (tmp_path / "._doc.txt").write_text("")
+    (tmp_path / "._movie.mp4").touch()
+    (tmp_path / "._doc.txt").touch()
     videos, non_videos = find_files(str(tmp_path))
     assert len(videos) == 1
     assert len(non_videos) == 1
     all_files = videos + non_videos
     assert all(not f.split("/")[-1].startswith("._") for f in all_files)
     assert all(not f.split("\\")[-1].startswith("._") for f in all_files)
+
+
+def test_find_files_deeply_nested(tmp_path):
+    # Files several levels down are found alongside top-level ones
+    deep = tmp_path / "a" / "b" / "c"
+    deep.mkdir(parents=True)
+    (tmp_path / "top.mkv").touch()
+    (deep / "deep.mp4").touch()
+    (deep / "deep.nfo").touch()
+    videos, non_videos = find_files(str(tmp_path))
+    assert sorted(os.path.basename(f) for f in videos) == ["deep.mp4", "top.mkv"]
+    assert [os.path.basename(f) for f in non_videos] == ["deep.nfo"]
+
+
+def test_iter_files_is_lazy(tmp_path):
+    (tmp_path / "a.mp4").touch()
+    (tmp_path / "b.txt").touch()
+    (tmp_path / "._c.mp4").touch()
+    it = iter_files(str(tmp_path))
+    assert not isinstance(it, list)
+    items = {os.path.basename(p): is_video for p, is_video in it}
+    assert items == {"a.mp4": True, "b.txt": False}
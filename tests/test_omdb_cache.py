@@ -0,0 +1,116 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from video_sweep import omdb_cache
+from video_sweep.omdb import query_omdb
+
+
+def test_get_cache_path_uses_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("VIDEO_SWEEP_CACHE_DIR", str(tmp_path))
+    assert omdb_cache.get_cache_path() == os.path.join(str(tmp_path), "omdb.sqlite")
+
+
+def test_make_key_normalizes_title():
+    assert omdb_cache.make_key("  The Matrix ", "1999") == "the matrix|1999"
+    assert omdb_cache.make_key("The Matrix", None) == "the matrix|"
+
+
+def test_cache_round_trip():
+    payload = {"Title": "The Matrix", "Year": "1999", "Response": "True"}
+    assert omdb_cache.get_cached("The Matrix", "1999") is omdb_cache.MISS
+    omdb_cache.set_cached("The Matrix", "1999", payload)
+    assert omdb_cache.get_cached("the matrix", "1999") == payload
+    omdb_cache.set_cached("Nothing", None, None)
+    assert omdb_cache.get_cached("Nothing", None) is None
+
+
+def test_cache_entry_expires(monkeypatch):
+    omdb_cache.set_cached("Old Movie", "1950", {"Title": "Old Movie"})
+    now = omdb_cache.time.time()
+    monkeypatch.setattr(omdb_cache.time, "time", lambda: now + omdb_cache.CACHE_TTL + 1)
+    assert omdb_cache.get_cached("Old Movie", "1950") is omdb_cache.MISS
+
+
+def test_negative_entry_expires_sooner(monkeypatch):
+    omdb_cache.set_cached("Misspeled", "2001", None)
+    now = omdb_cache.time.time()
+    later = now + omdb_cache.NEGATIVE_CACHE_TTL + 1
+    monkeypatch.setattr(omdb_cache.time, "time", lambda: later)
+    assert later - now < omdb_cache.CACHE_TTL
+    assert omdb_cache.get_cached("Misspeled", "2001") is omdb_cache.MISS
+
+
+def test_cache_honours_custom_ttl(monkeypatch):
+    omdb_cache.set_cached("Old Movie", "1950", {"Title": "Old Movie"})
+    now = omdb_cache.time.time()
+    monkeypatch.setattr(omdb_cache.time, "time", lambda: now + 120)
+    assert omdb_cache.get_cached("Old Movie", "1950", ttl=60) is omdb_cache.MISS
+    assert omdb_cache.get_cached("Old Movie", "1950", ttl=3600) is not omdb_cache.MISS
+
+
+def test_cache_unavailable_is_a_miss(monkeypatch):
+    def broken_connect():
+        raise omdb_cache.sqlite3.OperationalError("unable to open database")
+
+    monkeypatch.setattr(omdb_cache, "_connect", broken_connect)
+    omdb_cache.set_cached("The Matrix", "1999", {"Title": "The Matrix"})
+    assert omdb_cache.get_cached("The Matrix", "1999") is omdb_cache.MISS
+
+
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake")
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_uses_cache(mock_session, mock_key):
+    mock_get = mock_session.return_value.get
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.json.return_value = {
+        "Title": "The Matrix",
+        "Year": "1999",
+        "Response": "True",
+    }
+    mock_get.return_value = mock_resp
+    first = query_omdb("The Matrix", "1999")
+    assert query_omdb("The Matrix", "1999") == first
+    assert first["Title"] == "The Matrix"
+    assert mock_get.call_count == 1
+
+
+@patch("video_sweep.omdb.get_api_key_from_config", return_value=None)
+def test_query_omdb_without_key_is_not_cached(mock_key):
+    assert query_omdb("The Matrix", "1999") is None
+    assert omdb_cache.get_cached("The Matrix", "1999") is omdb_cache.MISS
+
+
+@pytest.mark.parametrize("status", [401, 503])
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake")
+@patch("video_sweep.omdb._get_session")
+def test_failed_lookup_is_not_cached(mock_session, mock_key, status):
+    failed = MagicMock(status_code=status)
+    failed.json.return_value = {"Response": "False", "Error": "Request limit reached!"}
+    found = MagicMock(status_code=200)
+    found.json.return_value = {"Title": "Heat", "Year": "1995", "Response": "True"}
+    mock_session.return_value.get.side_effect = [failed, found]
+    assert query_omdb("Heat", "1995") is None
+    assert omdb_cache.get_cached("Heat", "1995") is omdb_cache.MISS
+    assert query_omdb("Heat", "1995")["Title"] == "Heat"
+
+
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake")
+@patch("video_sweep.omdb._get_session")
+def test_error_with_status_200_is_not_cached(mock_session, mock_key):
+    limited = MagicMock(status_code=200)
+    limited.json.return_value = {"Response": "False", "Error": "Invalid API key!"}
+    mock_session.return_value.get.return_value = limited
+    assert query_omdb("Heat", "1995") is None
+    assert omdb_cache.get_cached("Heat", "1995") is omdb_cache.MISS
+
+
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="fake")
+@patch("video_sweep.omdb._get_session")
+def test_not_found_is_cached_as_a_miss(mock_session, mock_key):
+    missing = MagicMock(status_code=200)
+    missing.json.return_value = {"Response": "False", "Error": "Movie not found!"}
+    mock_session.return_value.get.return_value = missing
+    assert query_omdb("Nothing Like It", "2001") is None
+    assert omdb_cache.get_cached("Nothing Like It", "2001") is None
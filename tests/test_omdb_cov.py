@@ -1,19 +1,21 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import requests
 from video_sweep.omdb import query_omdb, get_api_key_from_config, get_suggested_name
 
 
 # Test get_api_key_from_config exception handling
-@patch("video_sweep.omdb.toml.load", side_effect=Exception("fail"))
+@patch("video_sweep.omdb.tomllib.load", side_effect=Exception("fail"))
 def test_get_api_key_from_config_exception(mock_toml):
     assert get_api_key_from_config() is None
 
 
 # Test query_omdb: fuzzy search with no matches
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_fuzzy_no_match(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_fuzzy_no_match(mock_session, mock_key):
+    mock_get = mock_session.return_value.get
+
     # direct fails, search returns no results
     def side_effect(*args, **kwargs):
         url = args[0]
@@ -37,8 +39,10 @@ def test_query_omdb_fuzzy_no_match(mock_get, mock_key):
 
 # Test query_omdb: fuzzy search with match below threshold
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_fuzzy_below_threshold(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_fuzzy_below_threshold(mock_session, mock_key):
+    mock_get = mock_session.return_value.get
+
     def side_effect(*args, **kwargs):
         url = args[0]
         if "t=" in url or kwargs.get("params", {}).get("t"):
@@ -85,8 +89,9 @@ def test_query_omdb_fuzzy_below_threshold(mock_get, mock_key):
 
 # Test query_omdb: title with only non-alphabetic characters
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_title_nonalpha(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_title_nonalpha(mock_session, mock_key):
+    mock_get = mock_session.return_value.get
     mock_get.return_value.status_code = 200
     mock_get.return_value.json.return_value = {"Response": "False"}
     assert query_omdb("1234567890!@#$", "2020") is None
@@ -107,9 +112,10 @@ def test_get_suggested_name_missing(data, expected):
 
 # New tests for HTTP error codes
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_http_429_rate_limit(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_http_429_rate_limit(mock_session, mock_key):
     """Test query_omdb with HTTP 429 (rate limit)."""
+    mock_get = mock_session.return_value.get
     mock_get.return_value.status_code = 429
     mock_get.return_value.json.return_value = {}
     result = query_omdb("Movie", "2020")
@@ -118,9 +124,10 @@ def test_query_omdb_http_429_rate_limit(mock_get, mock_key):
 
 
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_http_500_server_error(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_http_500_server_error(mock_session, mock_key):
     """Test query_omdb with HTTP 500 (server error)."""
+    mock_get = mock_session.return_value.get
     mock_get.return_value.status_code = 500
     mock_get.return_value.json.return_value = {}
     result = query_omdb("Movie", "2020")
@@ -129,9 +136,10 @@ def test_query_omdb_http_500_server_error(mock_get, mock_key):
 
 
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_http_503_service_unavailable(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_http_503_service_unavailable(mock_session, mock_key):
     """Test query_omdb with HTTP 503 (service unavailable)."""
+    mock_get = mock_session.return_value.get
     mock_get.return_value.status_code = 503
     mock_get.return_value.json.return_value = {}
     result = query_omdb("Movie", "2020")
@@ -139,9 +147,10 @@ def test_query_omdb_http_503_service_unavailable(mock_get, mock_key):
 
 
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_http_401_unauthorized(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_http_401_unauthorized(mock_session, mock_key):
     """Test query_omdb with HTTP 401 (unauthorized/invalid API key)."""
+    mock_get = mock_session.return_value.get
     mock_get.return_value.status_code = 401
     mock_get.return_value.json.return_value = {"Error": "Invalid API key"}
     result = query_omdb("Movie", "2020")
@@ -150,9 +159,10 @@ def test_query_omdb_http_401_unauthorized(mock_get, mock_key):
 
 # Test network timeout
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_timeout(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_timeout(mock_session, mock_key):
     """Test query_omdb with network timeout."""
+    mock_get = mock_session.return_value.get
     mock_get.side_effect = requests.exceptions.Timeout("Connection timed out")
     # Should handle timeout gracefully
     with pytest.raises(requests.exceptions.Timeout):
@@ -161,9 +171,10 @@ def test_query_omdb_timeout(mock_get, mock_key):
 
 # Test malformed JSON response
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_malformed_json(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_malformed_json(mock_session, mock_key):
     """Test query_omdb when response.json() throws exception."""
+    mock_get = mock_session.return_value.get
     mock_get.return_value.status_code = 200
     mock_get.return_value.json.side_effect = ValueError("Invalid JSON")
     # Should handle JSON error gracefully
@@ -173,9 +184,10 @@ def test_query_omdb_malformed_json(mock_get, mock_key):
 
 # Test search response missing imdbID
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_search_missing_imdbid(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_search_missing_imdbid(mock_session, mock_key):
     """Test fuzzy search when result is missing imdbID."""
+    mock_get = mock_session.return_value.get
 
     def side_effect(*args, **kwargs):
         params = kwargs.get("params", {})
@@ -212,9 +224,10 @@ def test_query_omdb_search_missing_imdbid(mock_get, mock_key):
 
 # Test search response missing Search key
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_search_missing_search_key(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_search_missing_search_key(mock_session, mock_key):
     """Test fuzzy search when response is missing Search key."""
+    mock_get = mock_session.return_value.get
 
     def side_effect(*args, **kwargs):
         params = kwargs.get("params", {})
@@ -244,9 +257,10 @@ def test_query_omdb_search_missing_search_key(mock_get, mock_key):
 
 # Test ID lookup failure
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_id_lookup_fails(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_id_lookup_fails(mock_session, mock_key):
     """Test when ID lookup (third request) fails."""
+    mock_get = mock_session.return_value.get
 
     def side_effect(*args, **kwargs):
         params = kwargs.get("params", {})
@@ -290,9 +304,10 @@ def test_query_omdb_id_lookup_fails(mock_get, mock_key):
 
 # Test fuzzy search with year matching
 @patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
-@patch("video_sweep.omdb.requests.get")
-def test_query_omdb_fuzzy_year_match(mock_get, mock_key):
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_fuzzy_year_match(mock_session, mock_key):
     """Test fuzzy search year matching logic."""
+    mock_get = mock_session.return_value.get
 
     def side_effect(*args, **kwargs):
         params = kwargs.get("params", {})
@@ -353,3 +368,59 @@ def test_query_omdb_fuzzy_year_match(mock_get, mock_key):
     # Should prefer year match
     assert result is not None
     assert result["Year"] == "2020"
+
+
+@patch("video_sweep.omdb._get_session")
+def test_fuzzy_search_is_memoized(mock_session):
+    mock_get = mock_session.return_value.get
+    from video_sweep.omdb import fuzzy_search
+
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.json.return_value = {"Response": "False"}
+    assert fuzzy_search("key", "Some Title", "Some Title", "2001") is None
+    assert fuzzy_search("key", "Some Title", "Some Title", "2001") is None
+    assert mock_get.call_count == 1
+
+
+@patch("video_sweep.omdb._get_session")
+def test_fuzzy_search_does_not_memoize_failures(mock_session):
+    from video_sweep.omdb import _LookupFailed, fuzzy_search
+
+    search = {
+        "Response": "True",
+        "Search": [{"Title": "Heat", "Year": "1995", "imdbID": "tt0113277"}],
+    }
+    record = {"Title": "Heat", "Year": "1995", "Response": "True"}
+    responses = [
+        MagicMock(status_code=503),
+        MagicMock(status_code=200, **{"json.return_value": search}),
+        MagicMock(status_code=401),
+        MagicMock(status_code=200, **{"json.return_value": search}),
+        MagicMock(status_code=200, **{"json.return_value": record}),
+    ]
+    mock_session.return_value.get.side_effect = responses
+    # A failed search, then a failed id lookup, are retried on the next call
+    for _ in range(2):
+        with pytest.raises(_LookupFailed):
+            fuzzy_search("key", "Heat", "Heat", "1995")
+    assert fuzzy_search("key", "Heat", "Heat", "1995") == record
+    assert fuzzy_search("key", "Heat", "Heat", "1995") == record
+    assert mock_session.return_value.get.call_count == 5
+
+
+@patch("video_sweep.omdb.get_api_key_from_config", return_value="dummykey")
+@patch("video_sweep.omdb._get_session")
+def test_query_omdb_caps_title_shortening(mock_session, mock_key):
+    """A miss on a long title searches at most two shortened titles."""
+    mock_get = mock_session.return_value.get
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.json.return_value = {"Response": "False"}
+    assert query_omdb("One Two Three Four Five Six", "2001") is None
+    searched = [c.kwargs["params"].get("s") for c in mock_get.call_args_list]
+    # Direct lookup, full-title search, then two shortenings
+    assert searched == [
+        None,
+        "One Two Three Four Five Six",
+        "One Two Three Four Five",
+        "One Two Three Four",
+    ]
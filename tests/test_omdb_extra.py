@@ -14,8 +14,28 @@ def test_get_api_key_from_config_success(tmp_path, monkeypatch):
     assert omdb.get_api_key_from_config() == "abc123"
 
 
+def test_read_api_key_is_cached(tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('[omdb]\napi_key = "abc123"\n')
+    assert omdb._read_api_key(str(config_path)) == "abc123"
+    config_path.write_text('[omdb]\napi_key = "changed"\n')
+    assert omdb._read_api_key(str(config_path)) == "abc123"
+    omdb.invalidate_api_key_cache()
+    assert omdb._read_api_key(str(config_path)) == "changed"
+
+
+def test_get_cache_ttl_from_config(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[omdb]\ncache_ttl_days = 2\n")
+    monkeypatch.setattr(omdb, "_config_path", lambda: str(config_path))
+    assert omdb.get_cache_ttl() == 2 * 24 * 60 * 60
+    config_path.write_text('[omdb]\napi_key = "abc123"\n')
+    omdb.invalidate_api_key_cache()
+    assert omdb.get_cache_ttl() == omdb.CACHE_TTL
+
+
 def test_get_api_key_from_config_missing(monkeypatch):
-    monkeypatch.setattr(omdb.toml, "load", lambda path: {})
+    monkeypatch.setattr(omdb.tomllib, "load", lambda f: {})
     assert omdb.get_api_key_from_config() is None
 
 
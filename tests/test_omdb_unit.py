@@ -1,3 +1,4 @@
+import pytest
 from video_sweep.omdb import get_api_key_from_config, get_suggested_name
 
 
@@ -20,3 +21,103 @@ def test_get_suggested_name_valid():
 def test_get_suggested_name_none():
     assert get_suggested_name(None) is None
     assert get_suggested_name({}) is None
+
+
+def test_title_similarity_falls_back_to_difflib(monkeypatch):
+    from video_sweep import omdb
+
+    monkeypatch.setattr(omdb, "_rapidfuzz_ratio", None)
+    assert omdb.title_similarity("the matrix", "the matrix") == 1.0
+    assert omdb.title_similarity("the matrix", "matrix") == 0.75
+    assert omdb.title_similarity("abc", "xyz") == 0.0
+
+
+@pytest.mark.smoke
+def test_importing_omdb_does_not_import_requests():
+    import subprocess
+    import sys
+
+    code = "import sys, video_sweep.cli; print('requests' in sys.modules)"
+    # close_fds=False lets CPython start the child with posix_spawn/vfork
+    out = subprocess.run(  # noqa: S603 - fixed interpreter and code
+        [sys.executable, "-c", code], capture_output=True, check=True, close_fds=False
+    ).stdout
+    assert out.strip() == b"False"
+
+
+def test_title_similarities_matches_pairwise(monkeypatch):
+    from video_sweep import omdb
+
+    monkeypatch.setattr(omdb, "_rapidfuzz_ratio", None)
+    candidates = ["the matrix", "the matrix reloaded", "the animatrix", ""]
+    assert omdb.title_similarities(candidates, "the matrix") == [
+        omdb.title_similarity(c, "the matrix") for c in candidates
+    ]
+    assert omdb.title_similarities([], "the matrix") == []
+
+
+def test_title_similarities_cutoff_skips_hopeless_candidates(monkeypatch):
+    from video_sweep import omdb
+
+    monkeypatch.setattr(omdb, "_rapidfuzz_ratio", None)
+    candidates = ["the matrix", "the matrix reloaded", "the animatrix", "a"]
+    assert omdb.title_similarities(candidates, "the matrix", 0.8) == [
+        1.0,
+        0.0,
+        omdb.title_similarity("the animatrix", "the matrix"),
+        0.0,
+    ]
+
+
+def test_best_search_match_prefers_exact_title_and_year(monkeypatch):
+    from video_sweep import omdb
+
+    items = [
+        {"Title": "Dune", "Year": "1984"},
+        {"Title": "Dune", "Year": "2021"},
+        {"Title": "Dune: Part Two", "Year": "2024"},
+    ]
+    scored = []
+    real = omdb.title_similarities
+    monkeypatch.setattr(
+        omdb, "title_similarities", lambda *a: scored.append(a) or real(*a)
+    )
+    assert omdb.best_search_match(items, "Dune", "2021") is items[1]
+    assert omdb.best_search_match(items, "dune") is items[0]
+    assert not scored
+    assert omdb.best_search_match(items, "Dune Part Two", "2024") is items[2]
+    assert omdb.best_search_match(items, "Alien", "1979") is None
+
+
+def test_best_search_match_accepts_same_year_ratio_at_cutoff(monkeypatch):
+    from video_sweep import omdb
+
+    # "abcxy" scores exactly 0.6 against "abcde", which the year bonus lifts
+    # to the 0.8 threshold
+    monkeypatch.setattr(omdb, "_rapidfuzz_ratio", None)
+    items = [{"Title": "abcxy", "Year": "2000"}]
+    assert omdb.title_similarity("abcxy", "abcde") == 0.6
+    assert omdb.best_search_match(items, "abcde", "2000") is items[0]
+    assert omdb.best_search_match(items, "abcde", "2001") is None
+
+
+def test_session_uses_https_and_compression():
+    from video_sweep import omdb
+
+    session = omdb._create_session()
+    assert omdb.OMDB_URL.startswith("https://")
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert session.get_adapter(omdb.OMDB_URL).max_retries.total == 3
+
+
+def test_title_variants_order_and_dedup():
+    from video_sweep.omdb import title_variants
+
+    assert title_variants("The Matrix") == ["The Matrix"]
+    assert title_variants("Alien 3") == ["Alien 3", "Alien"]
+    assert title_variants("One Two Three Four Five") == [
+        "One Two Three Four Five",
+        "One Two Three Four",
+        "One Two Three",
+    ]
+    assert title_variants("1984") == ["1984"]
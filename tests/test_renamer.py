@@ -1,5 +1,7 @@
 import os
 from unittest.mock import patch
+
+import pytest
 from video_sweep.renamer import rename_and_move
 
 
@@ -9,7 +11,7 @@ def test_rename_and_move_movie(tmp_path):
     src.mkdir()
     tgt.mkdir()
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
     rename_and_move(str(video), "movie", str(tgt))
     assert os.path.exists(os.path.join(str(tgt), "movie [2023].mp4"))
 
@@ -20,7 +22,7 @@ def test_rename_and_move_series(tmp_path):
     src.mkdir()
     tgt.mkdir()
     video = src / "SeriesName (2014) - S04E01 - Other text.mkv"
-    video.write_text("")
+    video.touch()
     rename_and_move(str(video), "series", str(tgt))
     expected_path = os.path.join(
         str(tgt), "SeriesName", "Season 4", "SeriesName S04E01.mkv"
@@ -34,7 +36,7 @@ def test_rename_and_move_series_missing_episode(tmp_path, capsys):
     src.mkdir()
     tgt.mkdir()
     video = src / "SeriesName (2014) - Other text.mkv"
-    video.write_text("")
+    video.touch()
     rename_and_move(str(video), "series", str(tgt))
     # Should not move file, should print warning
     out = capsys.readouterr().out
@@ -50,7 +52,7 @@ def test_rename_and_move_movie_no_year(tmp_path, capsys):
     src.mkdir()
     tgt.mkdir()
     video = src / "moviefile.mp4"
-    video.write_text("")
+    video.touch()
     rename_and_move(str(video), "movie", str(tgt))
     out = capsys.readouterr().out
     assert "Warning: No year found" in out
@@ -63,7 +65,7 @@ def test_rename_and_move_target_exists(tmp_path, capsys):
     src.mkdir()
     tgt.mkdir()
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
     # Create target file first
     target = tgt / "movie [2023].mp4"
     target.write_text("already here")
@@ -78,7 +80,7 @@ def test_rename_and_move_dry_run(tmp_path, capsys):
     src.mkdir()
     tgt.mkdir()
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
     rename_and_move(str(video), "movie", str(tgt), dry_run=True)
     out = capsys.readouterr().out
     assert "Would move" in out
@@ -91,7 +93,7 @@ def test_rename_and_move_series_invalid(tmp_path, capsys):
     src.mkdir()
     tgt.mkdir()
     video = src / "Show SXXEYY.mkv"
-    video.write_text("")
+    video.touch()
     rename_and_move(str(video), "series", str(tgt))
     out = capsys.readouterr().out
     assert "No episode code found" in out
@@ -103,11 +105,11 @@ def test_rename_and_move_makedirs_failure(tmp_path, capsys):
     src = tmp_path / "source"
     src.mkdir()
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
     # Mock the entire rename_and_move flow to avoid directory creation
     with patch(
-        "video_sweep.renamer.shutil.move", side_effect=OSError("Permission denied")
+        "video_sweep.renamer.os.rename", side_effect=OSError("Permission denied")
     ):
         rename_and_move(str(video), "movie", str(tmp_path))
         out = capsys.readouterr().out
@@ -115,17 +117,15 @@ def test_rename_and_move_makedirs_failure(tmp_path, capsys):
 
 
 def test_rename_and_move_shutil_move_failure(tmp_path, capsys):
-    """Test rename_and_move when shutil.move fails."""
+    """Test rename_and_move when the rename fails."""
     src = tmp_path / "source"
     tgt = tmp_path / "target"
     src.mkdir()
     tgt.mkdir()
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
-    with patch(
-        "video_sweep.renamer.shutil.move", side_effect=OSError("File is locked")
-    ):
+    with patch("video_sweep.renamer.os.rename", side_effect=OSError("File is locked")):
         rename_and_move(str(video), "movie", str(tgt))
         out = capsys.readouterr().out
         assert "Failed to move" in out
@@ -138,7 +138,7 @@ def test_rename_and_move_movie_with_omdb_suggestion(tmp_path):
     src.mkdir()
     tgt.mkdir()
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
     rename_and_move(str(video), "movie", str(tgt), omdb_suggested_name="Inception")
     assert os.path.exists(os.path.join(str(tgt), "Inception.mp4"))
@@ -151,7 +151,7 @@ def test_rename_and_move_movie_omdb_suggestion_exists(tmp_path, capsys):
     src.mkdir()
     tgt.mkdir()
     video = src / "movie.2023.mp4"
-    video.write_text("")
+    video.touch()
 
     # Create target file
     target = tgt / "Inception.mp4"
@@ -169,7 +169,7 @@ def test_rename_and_move_unknown_kind(tmp_path):
     src.mkdir()
     tgt.mkdir()
     video = src / "file.mp4"
-    video.write_text("")
+    video.touch()
 
     rename_and_move(str(video), "unknown", str(tgt))
     # Should move file as-is for unknown kind
@@ -183,7 +183,7 @@ def test_rename_and_move_series_with_lowercase_episode(tmp_path):
     src.mkdir()
     tgt.mkdir()
     video = src / "SeriesName (2014) - s04e01 - Other text.mkv"
-    video.write_text("")
+    video.touch()
     rename_and_move(str(video), "series", str(tgt))
     # Should still find and convert to uppercase
     expected_path = os.path.join(
@@ -199,7 +199,113 @@ def test_rename_and_move_series_creates_directories(tmp_path):
     src.mkdir()
     # Don't create tgt, let rename_and_move create it
     video = src / "MyShow - S02E05.mkv"
-    video.write_text("")
+    video.touch()
     rename_and_move(str(video), "series", str(tgt))
     expected_path = os.path.join(str(tgt), "MyShow", "Season 2", "MyShow S02E05.mkv")
     assert os.path.exists(expected_path)
+
+
+def test_fast_move_cross_device_fallback(tmp_path):
+    """Test that a cross-filesystem rename falls back to copy and unlink."""
+    import errno
+    from video_sweep.renamer import _fast_move
+
+    src = tmp_path / "a.mp4"
+    dst = tmp_path / "b.mp4"
+    src.write_text("data")
+    with patch(
+        "video_sweep.renamer.os.rename",
+        side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+    ):
+        _fast_move(str(src), str(dst))
+    assert not src.exists()
+    assert dst.read_text() == "data"
+
+
+def test_fast_move_replace_overwrites(tmp_path):
+    """Test that replace=True overwrites an existing target."""
+    from video_sweep.renamer import _fast_move
+
+    src = tmp_path / "a.mp4"
+    dst = tmp_path / "b.mp4"
+    src.write_text("new")
+    dst.write_text("old")
+    _fast_move(str(src), str(dst), replace=True)
+    assert not src.exists()
+    assert dst.read_text() == "new"
+
+
+def test_rename_and_move_many(tmp_path, capsys):
+    """Test that batched moves skip clashing targets and report in order."""
+    from video_sweep.renamer import rename_and_move_many
+
+    src = tmp_path / "source"
+    tgt = tmp_path / "target"
+    src.mkdir()
+    first = src / "Movie.2020.mp4"
+    clash = src / "Movie 2020.mp4"
+    episode = src / "Show.S01E02.mkv"
+    for video in (first, clash, episode):
+        video.touch()
+    rename_and_move_many(
+        [
+            (str(first), "movie", str(tgt), None),
+            (str(clash), "movie", str(tgt), None),
+            (str(episode), "series", str(tgt), None),
+        ]
+    )
+    out = capsys.readouterr().out
+    assert (tgt / "Movie [2020].mp4").exists()
+    assert (tgt / "Show" / "Season 1" / "Show S01E02.mkv").exists()
+    assert clash.exists()
+    assert "already exists" in out
+    assert out.index("Show.S01E02.mkv ->") > out.index("Movie.2020.mp4 ->")
+
+
+@pytest.mark.parametrize("ignores_case", [False, True])
+def test_rename_and_move_many_case_only_targets(
+    tmp_path, capsys, monkeypatch, ignores_case
+):
+    """Test that targets differing only in case clash only where case is ignored."""
+    from video_sweep import renamer
+
+    monkeypatch.setattr(renamer, "_ignores_case", lambda directory: ignores_case)
+    src = tmp_path / "source"
+    tgt = tmp_path / "target"
+    (src / "a").mkdir(parents=True)
+    (src / "b").mkdir()
+    first = src / "a" / "movie.mkv"
+    second = src / "b" / "movie.mkv"
+    first.touch()
+    second.touch()
+    renamer.rename_and_move_many(
+        [
+            (str(first), "movie", str(tgt), "The Matrix [1999]"),
+            (str(second), "movie", str(tgt), "the matrix [1999]"),
+        ]
+    )
+    out = capsys.readouterr().out
+    assert (tgt / "The Matrix [1999].mkv").exists()
+    assert second.exists() == ignores_case
+    assert ("already exists" in out) == ignores_case
+
+
+def test_ignores_case_matches_the_filesystem(tmp_path):
+    """Test that _ignores_case reports how the directory really matches names."""
+    from video_sweep.renamer import _ignores_case
+
+    (tmp_path / "probe").touch()
+    expected = (tmp_path / "PROBE").exists()
+    assert _ignores_case(str(tmp_path / "Probe Dir" / "Season 1")) == expected
+
+
+def test_ensure_dir_creates_each_directory_once(tmp_path):
+    """Test that _ensure_dir only calls makedirs for unseen directories."""
+    from video_sweep import renamer
+
+    target = tmp_path / "a" / "b"
+    renamer._ensure_dir(str(target))
+    assert target.is_dir()
+    with patch("video_sweep.renamer.os.makedirs") as makedirs:
+        renamer._ensure_dir(str(target))
+    makedirs.assert_not_called()
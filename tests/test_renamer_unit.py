@@ -3,6 +3,7 @@ from unittest.mock import patch
 from video_sweep.renamer import (
     sanitize_filename,
     movie_new_filename,
+    parse_movie_filename,
     series_new_filename,
     validate_movie_name,
 )
@@ -41,6 +42,21 @@ def test_movie_new_filename(filename, expected):
     assert movie_new_filename(filename) == expected
 
 
+@pytest.mark.parametrize(
+    "filename,expected",
+    [
+        ("TestMovie.2022.mp4", ("TestMovie", "2022", "TestMovie [2022].mp4")),
+        ("NoYearHere.mp4", (None, None, None)),
+        ("2012 (2009).mp4", ("2012", "2009", "2012 [2009].mp4")),
+        ("1984.mkv", (None, None, "1984.mkv")),  # Title only, no year
+        ("The.Movie.2021.BluRay.mp4", ("The Movie", "2021", "The Movie [2021].mp4")),
+        ("Movie: Part?.2020.mkv", ("Movie Part", "2020", "Movie Part [2020].mkv")),
+    ],
+)
+def test_parse_movie_filename(filename, expected):
+    assert parse_movie_filename(filename) == expected
+
+
 @pytest.mark.parametrize(
     "filename,expected",
     [